@@ -3,6 +3,8 @@ package main
 import (
 	"context"
 	"os"
+	"os/signal"
+	"syscall"
 	"time"
 
 	"github.com/keagan/slopcannon/internal/config"
@@ -18,9 +20,24 @@ var (
 )
 
 func main() {
-	ctx := context.Background()
-
-	if err := rootCmd.ExecuteContext(ctx); err != nil {
+	// Cancel on Ctrl-C / SIGTERM so running ffmpeg processes are killed
+	// and the analysis unwinds instead of the process exiting mid-write
+	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+
+	// Restore default signal handling once the first signal lands, so a
+	// second Ctrl-C force-quits if something ignores the cancellation
+	go func() {
+		<-ctx.Done()
+		stop()
+	}()
+
+	// Cobra's error output goes through the log buffer to keep its order
+	rootCmd.SetErr(logging.Stderr())
+
+	err := rootCmd.ExecuteContext(ctx)
+	stop()
+	logging.Close()
+	if err != nil {
 		os.Exit(1)
 	}
 }
@@ -74,6 +91,7 @@ var analyzeCmd = &cobra.Command{
 		if err != nil {
 			return err
 		}
+		defer pipe.Close()
 
 		// Run analysis
 		opts := pipeline.AnalyzeOptions{
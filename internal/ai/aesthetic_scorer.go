@@ -2,12 +2,9 @@ package ai
 
 import (
 	"context"
-	"fmt"
 	"image"
+	"image/color"
 	"math"
-	"os"
-	"path/filepath"
-	"time"
 
 	"github.com/keagan/slopcannon/internal/clips"
 	"github.com/keagan/slopcannon/internal/ffmpeg"
@@ -30,33 +27,18 @@ func NewAestheticScorer(logger zerolog.Logger, exec *ffmpeg.Executor) *Aesthetic
 
 // Score analyzes visual aesthetics of clip keyframe
 func (a *AestheticScorer) Score(ctx context.Context, clip *clips.Clip) (float64, error) {
-	// Extract keyframe from middle of clip
-	keyframeTime := clip.Start + (clip.Duration / 2)
-	keyframePath := filepath.Join(os.TempDir(), fmt.Sprintf("keyframe_%s_%d.jpg", clip.ID, time.Now().UnixNano()))
-	defer os.Remove(keyframePath)
-
-	err := a.ffmpeg.ExtractFrame(ctx, clip.SourceURL, keyframeTime, keyframePath)
+	// Decode (or reuse) the keyframe from the middle of the clip
+	img, err := clipKeyframe(ctx, a.ffmpeg, clip)
 	if err != nil {
 		a.logger.Warn().Err(err).Str("clip", clip.ID).Msg("keyframe extraction failed")
 		return 0.0, err
 	}
 
-	// Load image
-	file, err := os.Open(keyframePath)
-	if err != nil {
-		return 0.0, err
-	}
-	defer file.Close()
-
-	img, _, err := image.Decode(file)
-	if err != nil {
-		return 0.0, fmt.Errorf("failed to decode image: %w", err)
-	}
-
-	// Calculate aesthetic metrics
-	colorfulness := a.calculateColorfulness(img)
-	contrast := a.calculateContrast(img)
-	brightness := a.calculateBrightness(img)
+	// Calculate aesthetic metrics from a single pass over the pixels
+	stats := collectImageStats(img)
+	colorfulness := a.calculateColorfulness(&stats)
+	contrast := a.calculateContrast(&stats)
+	brightness := a.calculateBrightness(&stats)
 
 	// Weighted combination
 	score := (0.4 * colorfulness) + (0.3 * contrast) + (0.3 * brightness)
@@ -72,24 +54,99 @@ func (a *AestheticScorer) Score(ctx context.Context, clip *clips.Clip) (float64,
 	return math.Max(0, math.Min(1, score)), nil
 }
 
-// calculateColorfulness measures color variance
-func (a *AestheticScorer) calculateColorfulness(img image.Image) float64 {
+// imageStats holds channel sums and a luma histogram gathered in one pass
+type imageStats struct {
+	rSum, gSum, bSum float64
+	pixels           float64
+	luma             [256]int
+}
+
+// aestheticSampleBudget caps how many pixels collectImageStats reads.
+// The metrics are frame-wide averages, so a strided grid is enough.
+const aestheticSampleBudget = 64 * 1024
+
+// collectImageStats walks the image once on a strided grid, accumulating
+// channel sums and bucketing 8-bit luminance into a histogram.
+// Decoded JPEG keyframes are *image.YCbCr, so that layout (and RGBA) is read
+// straight from the pixel planes instead of boxing a color.Color per pixel.
+func collectImageStats(img image.Image) imageStats {
+	var s imageStats
 	bounds := img.Bounds()
-	var rSum, gSum, bSum float64
-	pixels := float64(bounds.Dx() * bounds.Dy())
-
-	for y := bounds.Min.Y; y < bounds.Max.Y; y++ {
-		for x := bounds.Min.X; x < bounds.Max.X; x++ {
-			r, g, b, _ := img.At(x, y).RGBA()
-			rSum += float64(r >> 8)
-			gSum += float64(g >> 8)
-			bSum += float64(b >> 8)
+
+	step := int(math.Sqrt(float64(bounds.Dx()*bounds.Dy()) / aestheticSampleBudget))
+	if step < 1 {
+		step = 1
+	}
+
+	switch m := img.(type) {
+	case *image.YCbCr:
+		for y := bounds.Min.Y; y < bounds.Max.Y; y += step {
+			for x := bounds.Min.X; x < bounds.Max.X; x += step {
+				ci := m.COffset(x, y)
+				r, g, b := color.YCbCrToRGB(m.Y[m.YOffset(x, y)], m.Cb[ci], m.Cr[ci])
+				s.add(uint32(r), uint32(g), uint32(b))
+			}
+		}
+	case *image.RGBA:
+		for y := bounds.Min.Y; y < bounds.Max.Y; y += step {
+			for x := bounds.Min.X; x < bounds.Max.X; x += step {
+				i := m.PixOffset(x, y)
+				s.add(uint32(m.Pix[i]), uint32(m.Pix[i+1]), uint32(m.Pix[i+2]))
+			}
+		}
+	default:
+		for y := bounds.Min.Y; y < bounds.Max.Y; y += step {
+			for x := bounds.Min.X; x < bounds.Max.X; x += step {
+				r, g, b, _ := img.At(x, y).RGBA()
+				s.add(r>>8, g>>8, b>>8)
+			}
 		}
 	}
 
-	rMean := rSum / pixels
-	gMean := gSum / pixels
-	bMean := bSum / pixels
+	return s
+}
+
+// add accumulates one 8-bit RGB sample
+func (s *imageStats) add(r, g, b uint32) {
+	s.rSum += float64(r)
+	s.gSum += float64(g)
+	s.bSum += float64(b)
+	// Luminance formula in fixed point
+	s.luma[(299*r+587*g+114*b+500)/1000]++
+	s.pixels++
+}
+
+// lumaMoments returns the mean and variance of the luma histogram
+func (s *imageStats) lumaMoments() (mean, variance float64) {
+	if s.pixels == 0 {
+		return 0, 0
+	}
+
+	var sum, sqSum float64
+	for lum, count := range s.luma {
+		if count == 0 {
+			continue
+		}
+		v := float64(lum)
+		c := float64(count)
+		sum += v * c
+		sqSum += v * v * c
+	}
+
+	mean = sum / s.pixels
+	variance = (sqSum / s.pixels) - (mean * mean)
+	return mean, math.Max(0, variance)
+}
+
+// calculateColorfulness measures color variance
+func (a *AestheticScorer) calculateColorfulness(s *imageStats) float64 {
+	if s.pixels == 0 {
+		return 0
+	}
+
+	rMean := s.rSum / s.pixels
+	gMean := s.gSum / s.pixels
+	bMean := s.bSum / s.pixels
 
 	// Higher RGB variance = more colorful
 	variance := math.Abs(rMean-gMean) + math.Abs(gMean-bMean) + math.Abs(bMean-rMean)
@@ -97,23 +154,8 @@ func (a *AestheticScorer) calculateColorfulness(img image.Image) float64 {
 }
 
 // calculateContrast measures luminance variance
-func (a *AestheticScorer) calculateContrast(img image.Image) float64 {
-	bounds := img.Bounds()
-	var lumSum, lumSqSum float64
-	pixels := float64(bounds.Dx() * bounds.Dy())
-
-	for y := bounds.Min.Y; y < bounds.Max.Y; y++ {
-		for x := bounds.Min.X; x < bounds.Max.X; x++ {
-			r, g, b, _ := img.At(x, y).RGBA()
-			// Luminance formula
-			lum := 0.299*float64(r>>8) + 0.587*float64(g>>8) + 0.114*float64(b>>8)
-			lumSum += lum
-			lumSqSum += lum * lum
-		}
-	}
-
-	mean := lumSum / pixels
-	variance := (lumSqSum / pixels) - (mean * mean)
+func (a *AestheticScorer) calculateContrast(s *imageStats) float64 {
+	_, variance := s.lumaMoments()
 	stdDev := math.Sqrt(variance)
 
 	// Normalize to 0-1 (typical stddev 0-60)
@@ -121,20 +163,8 @@ func (a *AestheticScorer) calculateContrast(img image.Image) float64 {
 }
 
 // calculateBrightness measures average luminance
-func (a *AestheticScorer) calculateBrightness(img image.Image) float64 {
-	bounds := img.Bounds()
-	var lumSum float64
-	pixels := float64(bounds.Dx() * bounds.Dy())
-
-	for y := bounds.Min.Y; y < bounds.Max.Y; y++ {
-		for x := bounds.Min.X; x < bounds.Max.X; x++ {
-			r, g, b, _ := img.At(x, y).RGBA()
-			lum := 0.299*float64(r>>8) + 0.587*float64(g>>8) + 0.114*float64(b>>8)
-			lumSum += lum
-		}
-	}
-
-	avgLum := lumSum / pixels
+func (a *AestheticScorer) calculateBrightness(s *imageStats) float64 {
+	avgLum, _ := s.lumaMoments()
 	// Prefer moderate brightness (not too dark, not blown out)
 	// Optimal around 128
 	deviation := math.Abs(avgLum - 128.0)
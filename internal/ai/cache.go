@@ -0,0 +1,146 @@
+package ai
+
+import (
+	"context"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+	"time"
+
+	"github.com/keagan/slopcannon/internal/ffmpeg"
+)
+
+// analysisCacheVersion invalidates cached entries when their layout or key
+// changes. Version 1 could hold empty results from failed analysis runs.
+const analysisCacheVersion = 2
+
+// analysisCacheEntry is the on-disk form of one probe + media analysis
+type analysisCacheEntry struct {
+	Duration time.Duration           `json:"duration"`
+	Scenes   []time.Duration         `json:"scenes"`
+	Silences []ffmpeg.SilenceSegment `json:"silences"`
+	Volume   ffmpeg.VolumeStats      `json:"volume"`
+}
+
+// DefaultAnalysisCacheDir returns the per-user directory for cached analyses
+func DefaultAnalysisCacheDir() (string, error) {
+	base, err := os.UserCacheDir()
+	if err != nil {
+		return "", fmt.Errorf("failed to resolve user cache dir: %w", err)
+	}
+	return filepath.Join(base, "slopcannon", "analysis"), nil
+}
+
+// analysisCacheKey fingerprints the input file and the analysis settings.
+// Size and modification time stand in for content, so an edited file misses;
+// the executor's fingerprint covers thresholds, hwaccel and filter chain.
+func (d *ClipDetector) analysisCacheKey(videoPath string) (string, error) {
+	absPath, err := filepath.Abs(videoPath)
+	if err != nil {
+		return "", err
+	}
+	info, err := os.Stat(absPath)
+	if err != nil {
+		return "", err
+	}
+
+	fingerprint := fmt.Sprintf("v%d|%s|%d|%d|%s",
+		analysisCacheVersion,
+		absPath,
+		info.Size(),
+		info.ModTime().UnixNano(),
+		d.ffmpeg.AnalysisFingerprint(d.analysisOptions()),
+	)
+	sum := sha256.Sum256([]byte(fingerprint))
+	return hex.EncodeToString(sum[:]), nil
+}
+
+// analyze returns the video duration and media analysis, served from the
+// on-disk cache when CacheDir is set and the file is unchanged
+func (d *ClipDetector) analyze(ctx context.Context, videoPath string) (time.Duration, *ffmpeg.MediaAnalysis, error) {
+	var key string
+	if d.config.CacheDir != "" {
+		var err error
+		key, err = d.analysisCacheKey(videoPath)
+		if err != nil {
+			d.logger.Debug().Err(err).Msg("analysis cache disabled for input")
+		} else if entry, ok := loadCachedAnalysis(d.config.CacheDir, key); ok {
+			d.logger.Info().Str("video", videoPath).Msg("using cached media analysis")
+			volume := entry.Volume
+			return entry.Duration, &ffmpeg.MediaAnalysis{
+				Scenes:   entry.Scenes,
+				Silences: entry.Silences,
+				Volume:   &volume,
+			}, nil
+		}
+	}
+
+	duration, analysis, err := d.runAnalysis(ctx, videoPath)
+	if err != nil {
+		return 0, nil, err
+	}
+
+	if key != "" && analysis.DecodeErrors > 0 {
+		d.logger.Warn().
+			Str("video", videoPath).
+			Int("decode_errors", analysis.DecodeErrors).
+			Msg("not caching media analysis of damaged input")
+	} else if key != "" {
+		entry := &analysisCacheEntry{
+			Duration: duration,
+			Scenes:   analysis.Scenes,
+			Silences: analysis.Silences,
+			Volume:   *analysis.Volume,
+		}
+		if err := saveCachedAnalysis(d.config.CacheDir, key, entry); err != nil {
+			d.logger.Warn().Err(err).Msg("failed to cache media analysis")
+		}
+	}
+
+	return duration, analysis, nil
+}
+
+// loadCachedAnalysis reads a cached entry, reporting whether one was found
+func loadCachedAnalysis(dir, key string) (*analysisCacheEntry, bool) {
+	data, err := os.ReadFile(filepath.Join(dir, key+".json"))
+	if err != nil {
+		return nil, false
+	}
+
+	var entry analysisCacheEntry
+	if err := json.Unmarshal(data, &entry); err != nil {
+		return nil, false
+	}
+	return &entry, true
+}
+
+// saveCachedAnalysis writes an entry atomically via a temp file and rename
+func saveCachedAnalysis(dir, key string, entry *analysisCacheEntry) error {
+	if err := os.MkdirAll(dir, 0755); err != nil {
+		return fmt.Errorf("failed to create cache dir: %w", err)
+	}
+
+	data, err := json.Marshal(entry)
+	if err != nil {
+		return fmt.Errorf("failed to encode analysis: %w", err)
+	}
+
+	tmp, err := os.CreateTemp(dir, key+".*.tmp")
+	if err != nil {
+		return fmt.Errorf("failed to create cache file: %w", err)
+	}
+	defer os.Remove(tmp.Name())
+
+	if _, err := tmp.Write(data); err != nil {
+		tmp.Close()
+		return fmt.Errorf("failed to write cache file: %w", err)
+	}
+	if err := tmp.Close(); err != nil {
+		return fmt.Errorf("failed to write cache file: %w", err)
+	}
+
+	return os.Rename(tmp.Name(), filepath.Join(dir, key+".json"))
+}
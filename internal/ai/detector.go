@@ -3,6 +3,9 @@ package ai
 import (
 	"context"
 	"fmt"
+	"runtime"
+	"sort"
+	"sync"
 	"time"
 
 	"github.com/keagan/slopcannon/internal/clips"
@@ -19,6 +22,8 @@ type DetectorConfig struct {
 	MinSilenceDuration float64
 	OverlapSeconds     float64
 	TopN               int
+	Workers            int    // concurrent candidate scorers; see defaultScoreWorkers
+	CacheDir           string // media analysis cache; empty disables caching
 }
 
 func DefaultDetectorConfig() DetectorConfig {
@@ -30,9 +35,19 @@ func DefaultDetectorConfig() DetectorConfig {
 		MinSilenceDuration: 1.0,
 		OverlapSeconds:     2.0,
 		TopN:               10,
+		Workers:            defaultScoreWorkers(),
 	}
 }
 
+// maxScoreWorkers caps the default scorer pool. Scoring decodes a keyframe
+// and runs CPU-bound inference, so more workers than this only oversubscribe.
+const maxScoreWorkers = 8
+
+// defaultScoreWorkers sizes the scorer pool from the CPUs this process may use
+func defaultScoreWorkers() int {
+	return min(runtime.GOMAXPROCS(0), maxScoreWorkers)
+}
+
 // ClipDetector finds viral-worthy clips
 type ClipDetector struct {
 	logger    zerolog.Logger
@@ -62,88 +77,164 @@ func NewDefaultClipDetector(logger zerolog.Logger, exec *ffmpeg.Executor, cfg De
 func (d *ClipDetector) Detect(ctx context.Context, videoPath string) ([]*clips.Clip, error) {
 	d.logger.Info().Str("video", videoPath).Msg("starting clip detection")
 
-	// Step 1: Probe video
-	info, err := d.ffmpeg.ProbeVideo(ctx, videoPath)
-	if err != nil {
-		return nil, fmt.Errorf("probe failed: %w", err)
-	}
-
-	// Step 2: Detect scene changes
-	scenes, err := d.ffmpeg.DetectScenes(ctx, videoPath, d.config.SceneThreshold)
-	if err != nil {
-		return nil, fmt.Errorf("scene detection failed: %w", err)
-	}
-
-	// Step 3: Detect silence periods
-	silences, err := d.ffmpeg.DetectSilence(ctx, videoPath,
-		d.config.SilenceThreshold, d.config.MinSilenceDuration)
-	if err != nil {
-		return nil, fmt.Errorf("silence detection failed: %w", err)
-	}
-
-	// Step 4: Analyze volume
-	volumeStats, err := d.ffmpeg.AnalyzeVolume(ctx, videoPath)
+	// Steps 1-2: Probe metadata and detect scenes, silence and volume
+	duration, analysis, err := d.analyze(ctx, videoPath)
 	if err != nil {
-		return nil, fmt.Errorf("volume analysis failed: %w", err)
+		return nil, err
 	}
+	scenes, silences, volumeStats := analysis.Scenes, analysis.Silences, analysis.Volume
 
-	// Step 5: Generate candidate clips
-	candidates := d.generateCandidates(scenes, silences, info.Duration)
+	// Step 3: Generate candidate clips
+	candidates := d.generateCandidates(scenes, silences, duration)
 
-	// Step 6: Score each candidate using the Scorer interface
-	scoredClips := make([]*clips.Clip, 0, len(candidates))
+	// Step 4: Build candidate clips with their features
+	features := d.extractAllFeatures(candidates, newSegmentIndex(scenes, silences), volumeStats)
+	clipStore := make([]clips.Clip, len(candidates))
+	scoredClips := make([]*clips.Clip, len(candidates))
 	for i, candidate := range candidates {
-		features := d.extractFeatures(candidate, scenes, silences, volumeStats)
-
-		clip := &clips.Clip{
+		clipStore[i] = clips.Clip{
 			ID:        fmt.Sprintf("clip_%d", i),
 			Start:     candidate.Start,
 			End:       candidate.End,
 			Duration:  candidate.End - candidate.Start,
 			SourceURL: videoPath,
 			Metadata: map[string]interface{}{
-				"scene_changes":  features.SceneChangeCount,
-				"silence_ratio":  features.SilenceRatio,
-				"peak_volume":    features.PeakVolume,
-				"mean_volume":    features.MeanVolume,
-				"audio_dynamics": features.AudioDynamics,
+				"scene_changes":  features[i].SceneChangeCount,
+				"silence_ratio":  features[i].SilenceRatio,
+				"peak_volume":    features[i].PeakVolume,
+				"mean_volume":    features[i].MeanVolume,
+				"audio_dynamics": features[i].AudioDynamics,
 			},
 		}
+		scoredClips[i] = &clipStore[i]
+	}
+
+	// Step 5: Score candidates concurrently using the Scorer interface
+	d.scoreClips(ctx, scoredClips)
+	if err := ctx.Err(); err != nil {
+		return nil, err
+	}
 
-		// Use the scorer interface
-		score, err := d.scorer.Score(ctx, clip)
-		if err != nil {
-			d.logger.Warn().Err(err).Str("clip_id", clip.ID).Msg("scoring failed, using 0")
-			score = 0.0
+	// Step 6: Sort and return top N
+	topClips := d.rankAndFilter(scoredClips)
+
+	event := d.logger.Info().
+		Int("candidates", len(candidates)).
+		Int("top_clips", len(topClips))
+	if len(topClips) > 0 {
+		event = event.
+			Float64("best_score", topClips[0].Score).
+			Float64("cutoff_score", topClips[len(topClips)-1].Score)
+	}
+	event.Msg("clip detection complete")
+
+	return topClips, nil
+}
+
+// analysisOptions returns the media analysis settings from the config
+func (d *ClipDetector) analysisOptions() ffmpeg.AnalysisOptions {
+	return ffmpeg.AnalysisOptions{
+		SceneThreshold:     d.config.SceneThreshold,
+		SilenceThreshold:   d.config.SilenceThreshold,
+		MinSilenceDuration: d.config.MinSilenceDuration,
+	}
+}
+
+// runAnalysis probes metadata while scenes, silence and volume are detected
+// in a single decode. Both only read the input, so they overlap.
+func (d *ClipDetector) runAnalysis(ctx context.Context, videoPath string) (time.Duration, *ffmpeg.MediaAnalysis, error) {
+	runCtx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	var info *ffmpeg.VideoInfo
+	var probeErr error
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		info, probeErr = d.ffmpeg.ProbeVideo(runCtx, videoPath)
+		if probeErr != nil {
+			cancel()
 		}
-		clip.Score = score
+	}()
+
+	analysis, err := d.ffmpeg.AnalyzeMedia(runCtx, videoPath, d.analysisOptions())
+	if err != nil {
+		cancel()
+	}
+	wg.Wait()
 
-		// Safe logging of optional clip_score metadata
-		var clipScoreVal float64
-		if v, ok := clip.Metadata["clip_score"]; ok {
-			if f, ok2 := v.(float64); ok2 {
-				clipScoreVal = f
+	if probeErr != nil {
+		return 0, nil, fmt.Errorf("probe failed: %w", probeErr)
+	}
+	if err != nil {
+		return 0, nil, fmt.Errorf("media analysis failed: %w", err)
+	}
+
+	return info.Duration, analysis, nil
+}
+
+// scoreClips scores clips on a bounded pool of workers.
+// Each clip is owned by exactly one worker, so scorers may write its Metadata.
+func (d *ClipDetector) scoreClips(ctx context.Context, candidates []*clips.Clip) {
+	workers := d.config.Workers
+	if workers <= 0 {
+		workers = 1
+	}
+	if workers > len(candidates) {
+		workers = len(candidates)
+	}
+
+	jobs := make(chan *clips.Clip)
+	var wg sync.WaitGroup
+
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for clip := range jobs {
+				d.scoreClip(ctx, clip)
 			}
-		}
+		}()
+	}
 
-		d.logger.Info().
-			Str("clip", clip.ID).
-			Float64("score_total", clip.Score).
-			Float64("score_clip", clipScoreVal).
-			Msg("ranked clip")
+	for _, clip := range candidates {
+		if ctx.Err() != nil {
+			break
+		}
+		jobs <- clip
+	}
+	close(jobs)
+	wg.Wait()
+}
 
-		scoredClips = append(scoredClips, clip)
+// scoreClip runs the scorer on a single clip, falling back to 0 on failure
+func (d *ClipDetector) scoreClip(ctx context.Context, clip *clips.Clip) {
+	score, err := d.scorer.Score(ctx, clip)
+	if err != nil {
+		d.logger.Warn().Err(err).Str("clip_id", clip.ID).Msg("scoring failed, using 0")
+		score = 0.0
 	}
+	clip.Score = score
 
-	// Step 7: Sort and return top N
-	topClips := d.rankAndFilter(scoredClips)
+	event := d.logger.Debug()
+	if !event.Enabled() {
+		return
+	}
 
-	d.logger.Info().
-		Int("candidates", len(candidates)).
-		Int("top_clips", len(topClips)).
-		Msg("clip detection complete")
+	// Safe logging of optional clip_score metadata
+	var clipScoreVal float64
+	if v, ok := clip.Metadata["clip_score"]; ok {
+		if f, ok2 := v.(float64); ok2 {
+			clipScoreVal = f
+		}
+	}
 
-	return topClips, nil
+	event.
+		Str("clip", clip.ID).
+		Float64("score_total", clip.Score).
+		Float64("score_clip", clipScoreVal).
+		Msg("scored clip")
 }
 
 // Close releases scorer resources
@@ -159,7 +250,7 @@ type candidateSegment struct {
 
 // generateCandidates creates candidate clips from scene boundaries
 func (d *ClipDetector) generateCandidates(scenes []time.Duration, silences []ffmpeg.SilenceSegment, totalDuration time.Duration) []candidateSegment {
-	var candidates []candidateSegment
+	candidates := make([]candidateSegment, 0, len(scenes)+1)
 
 	// Start from beginning
 	lastBoundary := time.Duration(0)
@@ -188,7 +279,7 @@ func (d *ClipDetector) generateCandidates(scenes []time.Duration, silences []ffm
 }
 
 func (d *ClipDetector) mergeShortSegments(segments []candidateSegment) []candidateSegment {
-	merged := make([]candidateSegment, 0)
+	merged := make([]candidateSegment, 0, len(segments))
 
 	for i := 0; i < len(segments); i++ {
 		current := segments[i]
@@ -215,26 +306,21 @@ func (d *ClipDetector) mergeShortSegments(segments []candidateSegment) []candida
 	return merged
 }
 
-// extractFeatures calculates features for a clip candidate
-func (d *ClipDetector) extractFeatures(segment candidateSegment, scenes []time.Duration, silences []ffmpeg.SilenceSegment, volumeStats *ffmpeg.VolumeStats) ClipFeatures {
-	// Count scene changes in this segment
-	sceneCount := 0
-	for _, scene := range scenes {
-		if scene >= segment.Start && scene <= segment.End {
-			sceneCount++
-		}
+// extractAllFeatures calculates features for every candidate into one preallocated slice.
+// Candidates are in timeline order, so one cursor sweeps the index once.
+func (d *ClipDetector) extractAllFeatures(candidates []candidateSegment, index *segmentIndex, volumeStats *ffmpeg.VolumeStats) []ClipFeatures {
+	features := make([]ClipFeatures, len(candidates))
+	cursor := index.cursor()
+	for i, candidate := range candidates {
+		features[i] = d.extractFeatures(candidate, cursor, volumeStats)
 	}
+	return features
+}
 
-	// Calculate silence ratio
-	silenceDuration := time.Duration(0)
-	for _, silence := range silences {
-		silStart := time.Duration(silence.Start * float64(time.Second))
-		silEnd := time.Duration(silence.End * float64(time.Second))
-
-		if silStart >= segment.Start && silEnd <= segment.End {
-			silenceDuration += silEnd - silStart
-		}
-	}
+// extractFeatures calculates features for a clip candidate
+func (d *ClipDetector) extractFeatures(segment candidateSegment, cursor *segmentCursor, volumeStats *ffmpeg.VolumeStats) ClipFeatures {
+	sceneCount := cursor.sceneCount(segment.Start, segment.End)
+	silenceDuration := cursor.silenceDuration(segment.Start, segment.End)
 
 	clipDuration := segment.End - segment.Start
 	silenceRatio := 0.0
@@ -254,14 +340,10 @@ func (d *ClipDetector) extractFeatures(segment candidateSegment, scenes []time.D
 
 // rankAndFilter sorts clips by score and returns top N
 func (d *ClipDetector) rankAndFilter(clips []*clips.Clip) []*clips.Clip {
-	// Sort by score descending
-	for i := 0; i < len(clips); i++ {
-		for j := i + 1; j < len(clips); j++ {
-			if clips[j].Score > clips[i].Score {
-				clips[i], clips[j] = clips[j], clips[i]
-			}
-		}
-	}
+	// Sort by score descending, keeping timeline order among ties
+	sort.SliceStable(clips, func(i, j int) bool {
+		return clips[i].Score > clips[j].Score
+	})
 
 	// Return top N
 	if len(clips) > d.config.TopN {
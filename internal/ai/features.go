@@ -1,6 +1,7 @@
 package ai
 
 import (
+	"sort"
 	"time"
 
 	"github.com/keagan/slopcannon/internal/ffmpeg"
@@ -25,3 +26,80 @@ type FeatureExtractor struct {
 func NewFeatureExtractor(exec *ffmpeg.Executor) *FeatureExtractor {
 	return &FeatureExtractor{ffmpeg: exec}
 }
+
+// segmentIndex holds sorted scene and silence timestamps plus a prefix sum
+// of silence durations for per-segment queries
+type segmentIndex struct {
+	scenes        []time.Duration
+	silenceStarts []time.Duration
+	silenceEnds   []time.Duration
+	silencePrefix []time.Duration // silencePrefix[i] = total silence in silences[:i]
+}
+
+// newSegmentIndex builds the index once per detection run
+func newSegmentIndex(scenes []time.Duration, silences []ffmpeg.SilenceSegment) *segmentIndex {
+	idx := &segmentIndex{
+		scenes:        append([]time.Duration(nil), scenes...),
+		silenceStarts: make([]time.Duration, len(silences)),
+		silenceEnds:   make([]time.Duration, len(silences)),
+		silencePrefix: make([]time.Duration, len(silences)+1),
+	}
+	sort.Slice(idx.scenes, func(i, j int) bool { return idx.scenes[i] < idx.scenes[j] })
+
+	sorted := append([]ffmpeg.SilenceSegment(nil), silences...)
+	sort.Slice(sorted, func(i, j int) bool { return sorted[i].Start < sorted[j].Start })
+
+	for i, silence := range sorted {
+		idx.silenceStarts[i] = time.Duration(silence.Start * float64(time.Second))
+		idx.silenceEnds[i] = time.Duration(silence.End * float64(time.Second))
+		idx.silencePrefix[i+1] = idx.silencePrefix[i] + idx.silenceEnds[i] - idx.silenceStarts[i]
+	}
+
+	return idx
+}
+
+// segmentCursor answers segmentIndex queries for segments visited in
+// timeline order. Each bound only moves forward, so a full sweep over sorted
+// candidates costs O(candidates + events) instead of a binary search per query.
+type segmentCursor struct {
+	idx                  *segmentIndex
+	sceneLo, sceneHi     int
+	silenceLo, silenceHi int
+}
+
+// cursor starts a new sweep over the index
+func (s *segmentIndex) cursor() *segmentCursor {
+	return &segmentCursor{idx: s}
+}
+
+// sceneCount returns the number of scene changes within [start, end]
+func (c *segmentCursor) sceneCount(start, end time.Duration) int {
+	c.sceneLo = seek(c.idx.scenes, c.sceneLo, start, false)
+	c.sceneHi = seek(c.idx.scenes, c.sceneHi, end, true)
+	return c.sceneHi - c.sceneLo
+}
+
+// silenceDuration returns the total length of silences fully inside [start, end].
+// ffmpeg reports non-overlapping silences, so contained ones form a contiguous run.
+func (c *segmentCursor) silenceDuration(start, end time.Duration) time.Duration {
+	c.silenceLo = seek(c.idx.silenceStarts, c.silenceLo, start, false)
+	c.silenceHi = seek(c.idx.silenceEnds, c.silenceHi, end, true)
+	if c.silenceHi <= c.silenceLo {
+		return 0
+	}
+	return c.idx.silencePrefix[c.silenceHi] - c.idx.silencePrefix[c.silenceLo]
+}
+
+// seek advances pos to the first timestamp at or after t (after t when
+// inclusive). A query that moves backwards falls back to a binary search.
+func seek(ts []time.Duration, pos int, t time.Duration, inclusive bool) int {
+	before := func(v time.Duration) bool { return v < t || (inclusive && v == t) }
+
+	if pos > 0 && !before(ts[pos-1]) {
+		return sort.Search(len(ts), func(i int) bool { return !before(ts[i]) })
+	}
+	for pos < len(ts) && before(ts[pos]) {
+		pos++
+	}
+	return pos
+}
@@ -0,0 +1,138 @@
+package ai
+
+import (
+	"math/rand"
+	"testing"
+	"time"
+
+	"github.com/keagan/slopcannon/internal/ffmpeg"
+)
+
+// linearSceneCount is the original per-candidate scene loop
+func linearSceneCount(scenes []time.Duration, start, end time.Duration) int {
+	count := 0
+	for _, scene := range scenes {
+		if scene >= start && scene <= end {
+			count++
+		}
+	}
+	return count
+}
+
+// linearSilenceDuration is the original per-candidate silence loop
+func linearSilenceDuration(silences []ffmpeg.SilenceSegment, start, end time.Duration) time.Duration {
+	var total time.Duration
+	for _, silence := range silences {
+		silStart := time.Duration(silence.Start * float64(time.Second))
+		silEnd := time.Duration(silence.End * float64(time.Second))
+		if silStart >= start && silEnd <= end {
+			total += silEnd - silStart
+		}
+	}
+	return total
+}
+
+type segmentQuery struct {
+	start, end time.Duration
+}
+
+// checkQueries runs queries on one cursor, in order, against the linear loops
+func checkQueries(t *testing.T, scenes []time.Duration, silences []ffmpeg.SilenceSegment, queries []segmentQuery) {
+	t.Helper()
+
+	cursor := newSegmentIndex(scenes, silences).cursor()
+	for _, q := range queries {
+		if got, want := cursor.sceneCount(q.start, q.end), linearSceneCount(scenes, q.start, q.end); got != want {
+			t.Errorf("sceneCount(%v, %v) = %d, want %d", q.start, q.end, got, want)
+		}
+		if got, want := cursor.silenceDuration(q.start, q.end), linearSilenceDuration(silences, q.start, q.end); got != want {
+			t.Errorf("silenceDuration(%v, %v) = %v, want %v", q.start, q.end, got, want)
+		}
+	}
+}
+
+func TestSegmentCursorBounds(t *testing.T) {
+	s := time.Second
+	scenes := []time.Duration{2 * s, 5 * s, 5 * s, 10 * s}
+	silences := []ffmpeg.SilenceSegment{
+		{Start: 1, End: 2, Duration: 1},
+		{Start: 5, End: 7, Duration: 2},
+		{Start: 10, End: 12, Duration: 2},
+	}
+
+	checkQueries(t, scenes, silences, []segmentQuery{
+		{0, 1 * s},       // before everything
+		{2 * s, 2 * s},   // zero-length on a scene and a silence end
+		{1 * s, 2 * s},   // exactly one silence
+		{2 * s, 5 * s},   // scenes on both bounds, silence starting at end
+		{5 * s, 7 * s},   // silence exactly on both bounds
+		{5 * s, 10 * s},  // duplicate scenes on the start bound
+		{7 * s, 12 * s},  // silence ending on the end bound
+		{12 * s, 20 * s}, // after everything
+	})
+}
+
+func TestSegmentCursorBackwardQueries(t *testing.T) {
+	s := time.Second
+	scenes := []time.Duration{1 * s, 3 * s, 6 * s, 9 * s}
+	silences := []ffmpeg.SilenceSegment{
+		{Start: 1, End: 2},
+		{Start: 4, End: 5},
+		{Start: 7, End: 8.5},
+	}
+
+	checkQueries(t, scenes, silences, []segmentQuery{
+		{6 * s, 10 * s},
+		{0, 5 * s},     // start and end both move back
+		{4 * s, 9 * s}, // forward again
+		{1 * s, 2 * s}, // back to exact bounds
+		{3 * s, 3 * s}, // zero-length between silences
+		{0, 20 * s},    // everything
+		{8 * s, 8500 * time.Millisecond},
+	})
+}
+
+func TestSegmentCursorEmpty(t *testing.T) {
+	queries := []segmentQuery{{0, time.Second}, {5 * time.Second, 10 * time.Second}, {0, 0}}
+	checkQueries(t, nil, nil, queries)
+	checkQueries(t, []time.Duration{time.Second}, nil, queries)
+	checkQueries(t, nil, []ffmpeg.SilenceSegment{{Start: 0, End: 1}}, queries)
+}
+
+func TestSegmentCursorMatchesLinearScan(t *testing.T) {
+	rng := rand.New(rand.NewSource(1))
+
+	for round := 0; round < 200; round++ {
+		// Whole-millisecond times so bounds collide often
+		at := func(max int) time.Duration { return time.Duration(rng.Intn(max)) * time.Millisecond }
+
+		scenes := make([]time.Duration, rng.Intn(30))
+		for i := range scenes {
+			scenes[i] = at(60000)
+		}
+
+		// Non-overlapping silences, as ffmpeg reports them, in random order
+		var silences []ffmpeg.SilenceSegment
+		for pos := at(3000); pos < 60*time.Second; pos += at(3000) + time.Millisecond {
+			end := pos + at(2000) + time.Millisecond
+			silences = append(silences, ffmpeg.SilenceSegment{Start: pos.Seconds(), End: end.Seconds()})
+			pos = end
+		}
+		rng.Shuffle(len(silences), func(i, j int) { silences[i], silences[j] = silences[j], silences[i] })
+
+		queries := make([]segmentQuery, 50)
+		for i := range queries {
+			start := at(60000)
+			if i > 0 && rng.Intn(4) > 0 {
+				// Mostly forward sweeps, as the detector issues them
+				start = queries[i-1].start + at(5000)
+			}
+			queries[i] = segmentQuery{start, start + at(20000)}
+		}
+
+		checkQueries(t, scenes, silences, queries)
+		if t.Failed() {
+			t.Fatalf("mismatch in round %d", round)
+		}
+	}
+}
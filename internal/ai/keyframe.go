@@ -0,0 +1,48 @@
+package ai
+
+import (
+	"context"
+	"image"
+	"sync"
+
+	"github.com/keagan/slopcannon/internal/clips"
+	"github.com/keagan/slopcannon/internal/ffmpeg"
+)
+
+type keyframeContextKey struct{}
+
+// keyframeCache holds one clip's decoded middle keyframe for the duration of
+// a single CompositeScorer.Score call, so the scorers it combines extract and
+// decode the frame once. It lives on the context, never in clip.Metadata.
+type keyframeCache struct {
+	clip *clips.Clip
+	once sync.Once
+	img  image.Image
+	err  error
+}
+
+// withKeyframeCache returns a context whose scorers share clip's keyframe
+func withKeyframeCache(ctx context.Context, clip *clips.Clip) context.Context {
+	return context.WithValue(ctx, keyframeContextKey{}, &keyframeCache{clip: clip})
+}
+
+// clipKeyframe returns the decoded middle keyframe of a clip. Under a
+// CompositeScorer the frame is extracted on first use and shared; a scorer
+// called on its own extracts it directly.
+func clipKeyframe(ctx context.Context, exec *ffmpeg.Executor, clip *clips.Clip) (image.Image, error) {
+	cache, ok := ctx.Value(keyframeContextKey{}).(*keyframeCache)
+	if !ok || cache.clip != clip {
+		return extractKeyframe(ctx, exec, clip)
+	}
+
+	cache.once.Do(func() {
+		cache.img, cache.err = extractKeyframe(ctx, exec, clip)
+	})
+	return cache.img, cache.err
+}
+
+// extractKeyframe decodes the frame at the middle of the clip
+func extractKeyframe(ctx context.Context, exec *ffmpeg.Executor, clip *clips.Clip) (image.Image, error) {
+	keyframeTime := clip.Start + (clip.Duration / 2)
+	return exec.ExtractFrameImage(ctx, clip.SourceURL, keyframeTime)
+}
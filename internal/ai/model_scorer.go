@@ -4,13 +4,12 @@ import (
 	"context"
 	"fmt"
 	"image"
+	"image/color"
 	_ "image/jpeg"
 	_ "image/png"
 	"math"
 	"os"
-	"path/filepath"
 	"sync"
-	"time"
 
 	"github.com/keagan/slopcannon/internal/clips"
 	"github.com/keagan/slopcannon/internal/ffmpeg"
@@ -44,6 +43,17 @@ func NewCLIPScorer(
 	ffmpegExec *ffmpeg.Executor,
 	encoderModelPath string,
 	headModelPath string,
+) (*CLIPScorer, error) {
+	return NewCLIPScorerWithOptions(logger, ffmpegExec, encoderModelPath, headModelPath, CLIPOptions{})
+}
+
+// NewCLIPScorerWithOptions creates a CLIP-based scorer with session tuning.
+func NewCLIPScorerWithOptions(
+	logger zerolog.Logger,
+	ffmpegExec *ffmpeg.Executor,
+	encoderModelPath string,
+	headModelPath string,
+	opts CLIPOptions,
 ) (*CLIPScorer, error) {
 	if _, err := os.Stat(encoderModelPath); os.IsNotExist(err) {
 		return nil, fmt.Errorf("encoder model file not found: %s", encoderModelPath)
@@ -60,11 +70,17 @@ func NewCLIPScorer(
 		return nil, fmt.Errorf("failed to initialize ONNX runtime: %w", onnxInitErr)
 	}
 
+	// Both sessions copy the options, so they can be released once created
+	sessionOpts := newSessionOptions(logger, opts)
+	if sessionOpts != nil {
+		defer sessionOpts.Destroy()
+	}
+
 	encoderSession, err := ort.NewDynamicAdvancedSession(
 		encoderModelPath,
 		[]string{"pixel_values"},
 		[]string{"image_embeds"},
-		nil,
+		sessionOpts,
 	)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create CLIP image encoder session: %w", err)
@@ -74,7 +90,7 @@ func NewCLIPScorer(
 		headModelPath,
 		[]string{"image_embeds"},
 		[]string{"score_logits"}, // or "score"
-		nil,
+		sessionOpts,
 	)
 	if err != nil {
 		encoderSession.Destroy()
@@ -89,7 +105,7 @@ func NewCLIPScorer(
 	return &CLIPScorer{
 		logger:         logger.With().Str("scorer", "clip").Logger(),
 		ffmpeg:         ffmpegExec,
-		inputShape:     ort.NewShape(1, 3, 224, 224),
+		inputShape:     ort.NewShape(1, 3, clipInputSize, clipInputSize),
 		encoderSession: encoderSession,
 		headSession:    headSession,
 	}, nil
@@ -97,19 +113,15 @@ func NewCLIPScorer(
 
 // Score runs CLIP image encoder + virality head on a keyframe.
 func (c *CLIPScorer) Score(ctx context.Context, clip *clips.Clip) (float64, error) {
-	// Extract keyframe from middle of clip
-	keyframeTime := clip.Start + (clip.Duration / 2)
-	keyframePath := filepath.Join(os.TempDir(),
-		fmt.Sprintf("clip_keyframe_%s_%d.jpg", clip.ID, time.Now().UnixNano()))
-	defer os.Remove(keyframePath)
-
-	if err := c.ffmpeg.ExtractFrame(ctx, clip.SourceURL, keyframeTime, keyframePath); err != nil {
+	// Decode (or reuse) the keyframe from the middle of the clip
+	img, err := clipKeyframe(ctx, c.ffmpeg, clip)
+	if err != nil {
 		c.logger.Warn().Err(err).Str("clip", clip.ID).Msg("keyframe extraction failed")
 		return 0.0, err
 	}
 
 	// IMAGE -> pixel_values
-	pixelTensor, err := c.preprocessImage(keyframePath)
+	pixelTensor, err := c.preprocessImage(img)
 	if err != nil {
 		return 0.0, fmt.Errorf("image preprocessing failed: %w", err)
 	}
@@ -165,48 +177,62 @@ func (c *CLIPScorer) Score(ctx context.Context, clip *clips.Clip) (float64, erro
 	return score, nil
 }
 
-// preprocessImage -> pixel_values (float32[1,3,224,224]) with CLIP normalization.
-func (c *CLIPScorer) preprocessImage(imagePath string) (ort.ArbitraryTensor, error) {
-	f, err := os.Open(imagePath)
-	if err != nil {
-		return nil, err
-	}
-	defer f.Close()
+// clipInputSize is the square resolution the CLIP encoder expects
+const clipInputSize = 224
 
-	img, _, err := image.Decode(f)
-	if err != nil {
-		return nil, err
+// clipNormLUT maps an 8-bit channel value to its CLIP-normalized float32 value
+var clipNormLUT = func() (lut [3][256]float32) {
+	mean := [3]float32{0.48145466, 0.4578275, 0.40821073}
+	std := [3]float32{0.26862954, 0.26130258, 0.27577711}
+	for ch := 0; ch < 3; ch++ {
+		for v := 0; v < 256; v++ {
+			lut[ch][v] = (float32(v)/255.0 - mean[ch]) / std[ch]
+		}
 	}
+	return lut
+}()
 
-	resized := resize.Resize(224, 224, img, resize.Bilinear)
-
-	data := make([]float32, 3*224*224)
-	mean := []float32{0.48145466, 0.4578275, 0.40821073}
-	std := []float32{0.26862954, 0.26130258, 0.27577711}
+// preprocessImage -> pixel_values (float32[1,3,224,224]) with CLIP normalization.
+func (c *CLIPScorer) preprocessImage(img image.Image) (ort.ArbitraryTensor, error) {
+	resized := resize.Resize(clipInputSize, clipInputSize, img, resize.Bilinear)
+	return ort.NewTensor(c.inputShape, clipPixelValues(resized))
+}
 
-	bounds := resized.Bounds()
+// clipPixelValues normalizes img into three channel planes. Pixels are read
+// once and written to all three planes via the lookup table. Decoded JPEG
+// keyframes stay *image.YCbCr through resize, so those planes are read
+// directly instead of through a color.Color per pixel.
+func clipPixelValues(img image.Image) []float32 {
+	bounds := img.Bounds()
+	plane := bounds.Dx() * bounds.Dy()
+	data := make([]float32, 3*plane)
 	idx := 0
 
-	for ch := 0; ch < 3; ch++ {
+	if ycc, ok := img.(*image.YCbCr); ok {
 		for y := bounds.Min.Y; y < bounds.Max.Y; y++ {
 			for x := bounds.Min.X; x < bounds.Max.X; x++ {
-				r, g, b, _ := resized.At(x, y).RGBA()
-				var v float32
-				switch ch {
-				case 0:
-					v = float32(r>>8) / 255.0
-				case 1:
-					v = float32(g>>8) / 255.0
-				case 2:
-					v = float32(b>>8) / 255.0
-				}
-				data[idx] = (v - mean[ch]) / std[ch]
+				ci := ycc.COffset(x, y)
+				r, g, b := color.YCbCrToRGB(ycc.Y[ycc.YOffset(x, y)], ycc.Cb[ci], ycc.Cr[ci])
+				data[idx] = clipNormLUT[0][r]
+				data[plane+idx] = clipNormLUT[1][g]
+				data[2*plane+idx] = clipNormLUT[2][b]
 				idx++
 			}
 		}
+		return data
+	}
+
+	for y := bounds.Min.Y; y < bounds.Max.Y; y++ {
+		for x := bounds.Min.X; x < bounds.Max.X; x++ {
+			r, g, b, _ := img.At(x, y).RGBA()
+			data[idx] = clipNormLUT[0][r>>8]
+			data[plane+idx] = clipNormLUT[1][g>>8]
+			data[2*plane+idx] = clipNormLUT[2][b>>8]
+			idx++
+		}
 	}
 
-	return ort.NewTensor(c.inputShape, data)
+	return data
 }
 
 // Close releases ONNX sessions and environment.
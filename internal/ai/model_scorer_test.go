@@ -0,0 +1,31 @@
+package ai
+
+import (
+	"image"
+	"math/rand"
+	"testing"
+)
+
+// opaqueImage hides the concrete type so clipPixelValues takes the generic path
+type opaqueImage struct{ image.Image }
+
+func TestClipPixelValuesYCbCrMatchesGeneric(t *testing.T) {
+	rng := rand.New(rand.NewSource(1))
+	for _, ratio := range []image.YCbCrSubsampleRatio{image.YCbCrSubsampleRatio444, image.YCbCrSubsampleRatio420} {
+		img := image.NewYCbCr(image.Rect(0, 0, 33, 17), ratio)
+		for _, p := range [][]uint8{img.Y, img.Cb, img.Cr} {
+			rng.Read(p)
+		}
+
+		fast := clipPixelValues(img)
+		generic := clipPixelValues(opaqueImage{img})
+		if len(fast) != len(generic) {
+			t.Fatalf("%v: got %d values, want %d", ratio, len(fast), len(generic))
+		}
+		for i := range fast {
+			if fast[i] != generic[i] {
+				t.Fatalf("%v: value %d = %v, want %v", ratio, i, fast[i], generic[i])
+			}
+		}
+	}
+}
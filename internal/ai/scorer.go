@@ -150,6 +150,9 @@ func (c *CompositeScorer) Score(ctx context.Context, clip *clips.Clip) (float64,
 	var totalScore float64
 	var totalWeight float64
 
+	// Image-based scorers share one decoded keyframe for this call
+	ctx = withKeyframeCache(ctx, clip)
+
 	for i, scorer := range c.scorers {
 		score, err := scorer.Score(ctx, clip)
 		if err != nil {
@@ -0,0 +1,64 @@
+package ai
+
+import (
+	"github.com/rs/zerolog"
+	ort "github.com/yalue/onnxruntime_go"
+)
+
+// CLIPOptions tunes the ONNX Runtime sessions behind a CLIPScorer
+type CLIPOptions struct {
+	UseCUDA        bool // run on the CUDA execution provider when it can be loaded
+	IntraOpThreads int  // threads within one operator; 0 = ONNX Runtime default
+	InterOpThreads int  // threads across independent operators; 0 = ONNX Runtime default
+}
+
+// newSessionOptions builds session options for opts. A nil result selects
+// ONNX Runtime's defaults (CPU, one intra-op thread per core). If the CUDA
+// provider cannot be appended, for example on a CPU-only runtime build,
+// sessions fall back to CPU with the remaining options applied.
+func newSessionOptions(logger zerolog.Logger, opts CLIPOptions) *ort.SessionOptions {
+	if !opts.UseCUDA && opts.IntraOpThreads <= 0 && opts.InterOpThreads <= 0 {
+		return nil
+	}
+
+	sessionOpts, err := ort.NewSessionOptions()
+	if err != nil {
+		logger.Warn().Err(err).Msg("failed to create ONNX session options; using defaults")
+		return nil
+	}
+
+	if opts.IntraOpThreads > 0 {
+		if err := sessionOpts.SetIntraOpNumThreads(opts.IntraOpThreads); err != nil {
+			logger.Warn().Err(err).Int("threads", opts.IntraOpThreads).Msg("failed to set ONNX intra-op threads")
+		}
+	}
+	if opts.InterOpThreads > 0 {
+		if err := sessionOpts.SetInterOpNumThreads(opts.InterOpThreads); err != nil {
+			logger.Warn().Err(err).Int("threads", opts.InterOpThreads).Msg("failed to set ONNX inter-op threads")
+		}
+	}
+
+	if opts.UseCUDA {
+		appendCUDA(logger, sessionOpts)
+	}
+
+	return sessionOpts
+}
+
+// appendCUDA adds the CUDA execution provider, logging instead of failing
+// when it is unavailable
+func appendCUDA(logger zerolog.Logger, sessionOpts *ort.SessionOptions) {
+	cudaOpts, err := ort.NewCUDAProviderOptions()
+	if err != nil {
+		logger.Warn().Err(err).Msg("CUDA execution provider unavailable; using CPU")
+		return
+	}
+	defer cudaOpts.Destroy()
+
+	if err := sessionOpts.AppendExecutionProviderCUDA(cudaOpts); err != nil {
+		logger.Warn().Err(err).Msg("CUDA execution provider unavailable; using CPU")
+		return
+	}
+
+	logger.Info().Msg("using CUDA execution provider for CLIP scoring")
+}
@@ -28,34 +28,95 @@ type Editor interface {
 	Merge(clips []*Clip) (*Clip, error)
 }
 
-// Manager handles clip operations
+// Manager handles clip operations.
+// Clips are kept in a slice for ordered iteration with an ID index for
+// constant-time lookup and removal. The zero value is ready to use.
 type Manager struct {
 	clips []*Clip
+	index map[string]int // ID -> position of the clip Get returns
+	dupes bool           // some ID has been added more than once
 }
 
 // NewManager creates a new clip manager
 func NewManager() *Manager {
 	return &Manager{
 		clips: make([]*Clip, 0),
+		index: make(map[string]int),
 	}
 }
 
-// Add adds a clip to the manager
+// Add adds a clip to the manager. Clips sharing an ID are all kept, and Get
+// returns an arbitrary one of them: Remove reorders storage, so it is the
+// first added only until a clip is removed.
 func (m *Manager) Add(clip *Clip) {
+	if m.index == nil {
+		m.index = make(map[string]int)
+	}
+	if _, ok := m.index[clip.ID]; ok {
+		m.dupes = true
+	} else {
+		m.index[clip.ID] = len(m.clips)
+	}
 	m.clips = append(m.clips, clip)
 }
 
-// Get retrieves a clip by ID
+// AddAll adds clips in one batch, growing storage once up front
+func (m *Manager) AddAll(clips []*Clip) {
+	if need := len(m.clips) + len(clips); need > cap(m.clips) {
+		grown := make([]*Clip, len(m.clips), need)
+		copy(grown, m.clips)
+		m.clips = grown
+	}
+	for _, clip := range clips {
+		m.Add(clip)
+	}
+}
+
+// Get retrieves a clip by ID, an arbitrary match if several share it
 func (m *Manager) Get(id string) *Clip {
-	for _, clip := range m.clips {
-		if clip.ID == id {
-			return clip
-		}
+	if i, ok := m.index[id]; ok {
+		return m.clips[i]
 	}
 	return nil
 }
 
-// All returns all clips
+// Remove deletes the clip Get would return for id, reporting whether one
+// was present. The last clip is moved into the freed slot, so order is not
+// preserved. If other clips share the ID, an arbitrary one of them becomes
+// the one Get returns.
+func (m *Manager) Remove(id string) bool {
+	i, ok := m.index[id]
+	if !ok {
+		return false
+	}
+
+	last := len(m.clips) - 1
+	if i != last {
+		moved := m.clips[last]
+		m.clips[i] = moved
+		if m.index[moved.ID] == last {
+			m.index[moved.ID] = i
+		}
+	}
+	m.clips[last] = nil
+	m.clips = m.clips[:last]
+	delete(m.index, id)
+
+	// Only a manager that has seen a duplicate ID pays for the rescan
+	if m.dupes {
+		for j, clip := range m.clips {
+			if clip.ID == id {
+				m.index[id] = j
+				break
+			}
+		}
+	}
+	return true
+}
+
+// All returns a copy of all clips, safe for the caller to sort or modify
 func (m *Manager) All() []*Clip {
-	return m.clips
+	all := make([]*Clip, len(m.clips))
+	copy(all, m.clips)
+	return all
 }
@@ -0,0 +1,106 @@
+package clips
+
+import "testing"
+
+func TestManagerZeroValue(t *testing.T) {
+	var m Manager
+	if m.Get("missing") != nil {
+		t.Error("expected nil for a missing ID")
+	}
+	if m.Remove("missing") {
+		t.Error("expected Remove to report a missing ID")
+	}
+
+	m.Add(&Clip{ID: "a"})
+	if got := m.Get("a"); got == nil || got.ID != "a" {
+		t.Fatalf("Get(a) = %v after Add on a zero Manager", got)
+	}
+}
+
+func TestManagerAddGetRemove(t *testing.T) {
+	m := NewManager()
+	for _, id := range []string{"a", "b", "c", "d"} {
+		m.Add(&Clip{ID: id})
+	}
+
+	if !m.Remove("b") {
+		t.Fatal("expected Remove(b) to succeed")
+	}
+	if m.Get("b") != nil {
+		t.Error("expected b to be gone")
+	}
+	if m.Remove("b") {
+		t.Error("expected a second Remove(b) to fail")
+	}
+	for _, id := range []string{"a", "c", "d"} {
+		if got := m.Get(id); got == nil || got.ID != id {
+			t.Errorf("Get(%s) = %v after removing b", id, got)
+		}
+	}
+
+	// Removing the last clip must not disturb the rest
+	if !m.Remove("c") || !m.Remove("d") || !m.Remove("a") {
+		t.Fatal("expected the remaining clips to be removable")
+	}
+	if n := len(m.All()); n != 0 {
+		t.Errorf("expected no clips left, got %d", n)
+	}
+}
+
+func TestManagerDuplicateIDs(t *testing.T) {
+	m := NewManager()
+	first := &Clip{ID: "x", Score: 1}
+	second := &Clip{ID: "x", Score: 2}
+	m.Add(first)
+	m.Add(&Clip{ID: "y"})
+	m.Add(second)
+
+	if n := len(m.All()); n != 3 {
+		t.Fatalf("expected duplicates to be kept, got %d clips", n)
+	}
+	if m.Get("x") != first {
+		t.Error("expected Get to return the first clip added")
+	}
+
+	m.Remove("x")
+	if m.Get("x") != second {
+		t.Error("expected the remaining duplicate after removing the first")
+	}
+	if got := m.Get("y"); got == nil || got.ID != "y" {
+		t.Errorf("Get(y) = %v after removing a duplicate", got)
+	}
+}
+
+func TestManagerAddAll(t *testing.T) {
+	m := NewManager()
+	m.Add(&Clip{ID: "a"})
+	m.AddAll([]*Clip{{ID: "b"}, {ID: "c"}})
+
+	all := m.All()
+	if len(all) != 3 {
+		t.Fatalf("expected 3 clips, got %d", len(all))
+	}
+	for i, id := range []string{"a", "b", "c"} {
+		if all[i].ID != id {
+			t.Errorf("All()[%d] = %s, want %s (insertion order)", i, all[i].ID, id)
+		}
+		if got := m.Get(id); got == nil || got.ID != id {
+			t.Errorf("Get(%s) = %v after AddAll", id, got)
+		}
+	}
+}
+
+func TestManagerAllIsACopy(t *testing.T) {
+	m := NewManager()
+	m.AddAll([]*Clip{{ID: "a"}, {ID: "b"}})
+
+	all := m.All()
+	all[0], all[1] = all[1], all[0]
+
+	if got := m.Get("a"); got == nil || got.ID != "a" {
+		t.Errorf("Get(a) = %v after reordering All()", got)
+	}
+	if !m.Remove("a") || m.Get("b") == nil {
+		t.Error("expected Remove and Get to be unaffected by reordering All()")
+	}
+}
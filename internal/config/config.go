@@ -2,8 +2,11 @@ package config
 
 import (
 	"context"
+	"fmt"
 	"os"
 	"path/filepath"
+	"reflect"
+	"strconv"
 
 	"gopkg.in/yaml.v3"
 )
@@ -17,7 +20,7 @@ type Config struct {
 	// Core settings
 	WorkDir     string `yaml:"work_dir"`
 	TempDir     string `yaml:"temp_dir"`
-	Concurrency int    `yaml:"concurrency"`
+	Concurrency int    `yaml:"concurrency"` // 0 = size from available CPUs
 
 	// AI settings
 	AI AIConfig `yaml:"ai"`
@@ -35,6 +38,9 @@ type Config struct {
 type AIConfig struct {
 	ModelPath      string  `yaml:"model_path" env:"AI_MODEL_PATH"`
 	UseModel       bool    `yaml:"use_model" env:"AI_USE_MODEL"`
+	UseGPU         bool    `yaml:"use_gpu" env:"AI_USE_GPU"`
+	IntraOpThreads int     `yaml:"intra_op_threads"` // 0 = ONNX Runtime default
+	InterOpThreads int     `yaml:"inter_op_threads"` // 0 = ONNX Runtime default
 	WhisperModel   string  `yaml:"whisper_model"`
 	ScoreThreshold float64 `yaml:"score_threshold"`
 }
@@ -43,6 +49,8 @@ type FFmpegConfig struct {
 	BinaryPath string `yaml:"binary_path"`
 	Threads    int    `yaml:"threads"`
 	Preset     string `yaml:"preset"`
+	HWAccel    string `yaml:"hwaccel"`
+	HWEncode   bool   `yaml:"hw_encode"`
 }
 
 type SubtitleConfig struct {
@@ -65,26 +73,91 @@ func Load(path string) (*Config, error) {
 		path = findConfigFile()
 	}
 
-	if path == "" {
-		return cfg, nil
-	}
-
-	data, err := os.ReadFile(path)
-	if err != nil {
-		if os.IsNotExist(err) {
-			return cfg, nil
+	if path != "" {
+		data, err := os.ReadFile(path)
+		if err != nil && !os.IsNotExist(err) {
+			return nil, err
+		}
+		if err == nil {
+			if err := yaml.Unmarshal(data, cfg); err != nil {
+				return nil, err
+			}
 		}
-		return nil, err
 	}
 
-	if err := yaml.Unmarshal(data, cfg); err != nil {
+	// Environment variables override the file
+	if err := applyEnv(cfg); err != nil {
 		return nil, err
 	}
 
 	return cfg, nil
 }
 
-// Save writes configuration to file
+// applyEnv overrides the fields tagged with env from the environment.
+// It runs once per Load, so callers holding the loaded Config never
+// re-read the environment.
+func applyEnv(cfg *Config) error {
+	return applyEnvFields(reflect.ValueOf(cfg).Elem())
+}
+
+// applyEnvFields sets each env-tagged field of the struct v whose variable
+// is set, descending into nested structs
+func applyEnvFields(v reflect.Value) error {
+	t := v.Type()
+	for i := 0; i < t.NumField(); i++ {
+		field := v.Field(i)
+		name, tagged := t.Field(i).Tag.Lookup("env")
+		if !tagged {
+			if field.Kind() == reflect.Struct {
+				if err := applyEnvFields(field); err != nil {
+					return err
+				}
+			}
+			continue
+		}
+
+		value, ok := os.LookupEnv(name)
+		if !ok {
+			continue
+		}
+		if err := setField(field, value); err != nil {
+			return fmt.Errorf("invalid %s: %w", name, err)
+		}
+	}
+	return nil
+}
+
+// setField parses value into a string, bool, integer or float field
+func setField(field reflect.Value, value string) error {
+	switch field.Kind() {
+	case reflect.String:
+		field.SetString(value)
+	case reflect.Bool:
+		b, err := strconv.ParseBool(value)
+		if err != nil {
+			return err
+		}
+		field.SetBool(b)
+	case reflect.Int, reflect.Int64:
+		n, err := strconv.ParseInt(value, 10, 64)
+		if err != nil {
+			return err
+		}
+		field.SetInt(n)
+	case reflect.Float64:
+		f, err := strconv.ParseFloat(value, 64)
+		if err != nil {
+			return err
+		}
+		field.SetFloat(f)
+	default:
+		return fmt.Errorf("unsupported field type %s", field.Type())
+	}
+	return nil
+}
+
+// Save writes configuration to file. A Config from Load includes its
+// environment overrides, so they are written too.
 func (c *Config) Save(path string) error {
 	data, err := yaml.Marshal(c)
 	if err != nil {
@@ -98,7 +171,7 @@ func defaultConfig() *Config {
 	return &Config{
 		WorkDir:     "./work",
 		TempDir:     "./temp",
-		Concurrency: 4,
+		Concurrency: 0,
 		AI: AIConfig{
 			ModelPath:      "./models/clip-vit-base.onnx",
 			UseModel:       true,
@@ -109,6 +182,7 @@ func defaultConfig() *Config {
 			BinaryPath: "ffmpeg",
 			Threads:    0,
 			Preset:     "medium",
+			HWAccel:    "auto",
 		},
 		Subtitles: SubtitleConfig{
 			FontName:     "Arial",
@@ -0,0 +1,27 @@
+package config
+
+import "testing"
+
+func TestApplyEnv(t *testing.T) {
+	t.Setenv("AI_MODEL_PATH", "/models/custom.onnx")
+	t.Setenv("AI_USE_GPU", "true")
+
+	cfg := defaultConfig()
+	if err := applyEnv(cfg); err != nil {
+		t.Fatalf("applyEnv failed: %v", err)
+	}
+	if cfg.AI.ModelPath != "/models/custom.onnx" || !cfg.AI.UseGPU {
+		t.Errorf("expected env overrides, got %+v", cfg.AI)
+	}
+	if !cfg.AI.UseModel {
+		t.Error("expected unset variables to keep their defaults")
+	}
+}
+
+func TestApplyEnvInvalid(t *testing.T) {
+	t.Setenv("AI_USE_MODEL", "sometimes")
+
+	if err := applyEnv(defaultConfig()); err == nil {
+		t.Error("expected an error for an unparsable bool")
+	}
+}
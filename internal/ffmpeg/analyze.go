@@ -0,0 +1,206 @@
+package ffmpeg
+
+import (
+	"context"
+	"fmt"
+	"strings"
+	"sync"
+	"time"
+)
+
+// sceneAnalysisWidth is the width frames are downscaled to before scene scoring.
+// Scene scores only need coarse structure, so scoring full-resolution frames
+// wastes most of the filter time.
+const sceneAnalysisWidth = 320
+
+// analysisCollector keeps only the stderr lines an output parser needs.
+// Memory is bounded by the number of detected events instead of the full
+// ffmpeg log, which on long inputs is dominated by progress and stream noise.
+type analysisCollector struct {
+	mu      sync.Mutex
+	buf     strings.Builder
+	lines   int
+	markers []string
+}
+
+// newAnalysisCollector creates a collector retaining lines containing any marker
+func newAnalysisCollector(markers ...string) *analysisCollector {
+	return &analysisCollector{markers: markers}
+}
+
+// collect records a stderr line if it carries analysis data
+func (c *analysisCollector) collect(line string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.lines++
+	for _, marker := range c.markers {
+		if strings.Contains(line, marker) {
+			c.buf.WriteString(line)
+			c.buf.WriteByte('\n')
+			return
+		}
+	}
+}
+
+// output returns the retained lines and the total number of lines seen
+func (c *analysisCollector) output() (string, int) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return c.buf.String(), c.lines
+}
+
+// Stderr markers for each analysis filter's output
+var (
+	sceneMarkers   = []string{"pts_time:"}
+	silenceMarkers = []string{"silence_start:", "silence_end:"}
+	volumeMarkers  = []string{"mean_volume:", "max_volume:"}
+	mediaMarkers   = append([]string{"pts_time:", "silence_start:", "silence_end:", "mean_volume:", "max_volume:"},
+		decodeErrorMarkers...)
+)
+
+// decodeErrorMarkers flag stderr lines where ffmpeg kept going past damaged
+// input, so the analysis may be missing events
+var decodeErrorMarkers = []string{"Error while decoding", "error while decoding", "Invalid data found"}
+
+// countMarkerLines returns how many output lines contain any of markers
+func countMarkerLines(output string, markers []string) int {
+	count := 0
+	for output != "" {
+		var line string
+		line, output, _ = strings.Cut(output, "\n")
+		for _, marker := range markers {
+			if strings.Contains(line, marker) {
+				count++
+				break
+			}
+		}
+	}
+	return count
+}
+
+// markerValue returns the first whitespace-delimited token after marker in
+// line. It slices the line in place, so parsing a value allocates nothing.
+func markerValue(line, marker string) (string, bool) {
+	_, rest, ok := strings.Cut(line, marker)
+	if !ok {
+		return "", false
+	}
+	rest = strings.TrimLeft(rest, " \t")
+	if i := strings.IndexAny(rest, " \t\r"); i >= 0 {
+		rest = rest[:i]
+	}
+	return rest, rest != ""
+}
+
+// runNullAnalysis runs an analysis pass to the null muxer and returns the
+// stderr lines matching markers. Shared by the combined and single-filter
+// analyses; name labels their log and error messages. Any ffmpeg failure is
+// an error: its message carries the stderr tail, so no pattern over it can
+// tell a benign exit from a bad filter or decode.
+func (e *Executor) runNullAnalysis(ctx context.Context, name string, args, markers []string) (string, error) {
+	collector := newAnalysisCollector(markers...)
+	debugMsg := name + " output"
+	debug := e.debugEnabled()
+
+	runOpts := RunOptions{
+		Args: append(args, "-f", "null", "-"),
+		LogHandler: func(line string) {
+			collector.collect(line)
+			if debug {
+				e.logger.Debug().Str("stderr", line).Msg(debugMsg)
+			}
+		},
+	}
+
+	err := e.Run(ctx, runOpts)
+	output, lines := collector.output()
+
+	if err != nil {
+		if ctx.Err() != nil {
+			return "", ctx.Err()
+		}
+		return "", fmt.Errorf("%s failed: %w", name, err)
+	}
+
+	if lines == 0 {
+		return "", fmt.Errorf("%s produced no output", name)
+	}
+
+	return output, nil
+}
+
+// AnalysisOptions configures the combined media analysis pass
+type AnalysisOptions struct {
+	SceneThreshold     float64
+	SilenceThreshold   float64
+	MinSilenceDuration float64
+}
+
+// MediaAnalysis holds scene, silence and volume results from one decode
+type MediaAnalysis struct {
+	Scenes       []time.Duration
+	Silences     []SilenceSegment
+	Volume       *VolumeStats
+	DecodeErrors int // stderr lines reporting damaged input; results may be partial
+}
+
+// mediaAnalysisArgs builds the combined analysis arguments for input
+func (e *Executor) mediaAnalysisArgs(input string, opts AnalysisOptions) []string {
+	var args []string
+	if e.hwaccel != "" {
+		args = append(args, "-hwaccel", e.hwaccel)
+	}
+	return append(args,
+		"-i", input,
+		"-vf", fmt.Sprintf("scale=%d:-2:flags=fast_bilinear,select='gt(scene,%f)',showinfo", sceneAnalysisWidth, opts.SceneThreshold),
+		"-af", fmt.Sprintf("silencedetect=noise=%.6fdB:d=%.6f,volumedetect", opts.SilenceThreshold, opts.MinSilenceDuration),
+	)
+}
+
+// AnalysisFingerprint identifies the settings AnalyzeMedia would run with
+// opts: hwaccel mode, scaling and the full filter chain. Results cached
+// under one fingerprint are stale once any of these change.
+func (e *Executor) AnalysisFingerprint(opts AnalysisOptions) string {
+	return strings.Join(e.mediaAnalysisArgs("", opts), " ")
+}
+
+// AnalyzeMedia runs scene, silence and volume detection in a single ffmpeg pass.
+// The video filter and audio filters share one demux/decode of the input
+// instead of three separate invocations.
+func (e *Executor) AnalyzeMedia(ctx context.Context, input string, opts AnalysisOptions) (*MediaAnalysis, error) {
+	e.logger.Info().
+		Str("input", input).
+		Float64("scene_threshold", opts.SceneThreshold).
+		Float64("noise_threshold", opts.SilenceThreshold).
+		Float64("min_duration", opts.MinSilenceDuration).
+		Msg("analyzing media")
+
+	args := e.mediaAnalysisArgs(input, opts)
+	output, err := e.runNullAnalysis(ctx, "media analysis", args, mediaMarkers)
+	if err != nil {
+		return nil, err
+	}
+
+	volume, err := e.parseVolumeOutput(output)
+	if err != nil {
+		return nil, fmt.Errorf("failed to parse volume stats: %w", err)
+	}
+
+	analysis := &MediaAnalysis{
+		Scenes:       parseSceneOutput(output),
+		Silences:     parseSilenceOutput(output),
+		Volume:       volume,
+		DecodeErrors: countMarkerLines(output, decodeErrorMarkers),
+	}
+
+	e.logger.Info().
+		Int("scenes", len(analysis.Scenes)).
+		Int("silences", len(analysis.Silences)).
+		Float64("mean_volume", volume.MeanVolume).
+		Float64("max_volume", volume.MaxVolume).
+		Int("decode_errors", analysis.DecodeErrors).
+		Msg("media analysis complete")
+
+	return analysis, nil
+}
@@ -1,12 +1,10 @@
 package ffmpeg
 
 import (
-	"bytes"
 	"context"
 	"fmt"
 	"strconv"
 	"strings"
-	"sync"
 )
 
 // AudioFormat defines audio extraction format options
@@ -53,9 +51,7 @@ func (e *Executor) ExtractAudio(ctx context.Context, input, output string, forma
 	opts := RunOptions{
 		Args:            args,
 		ProgressHandler: progressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("audio extraction")
-		},
+		LogHandler:      e.debugLogHandler("audio extraction"),
 	}
 
 	return e.Run(ctx, opts)
@@ -76,49 +72,13 @@ func (e *Executor) DetectSilence(ctx context.Context, input string, noiseThresho
 		Float64("min_duration", minDuration).
 		Msg("detecting silence")
 
-	var stderrBuf bytes.Buffer
-	var mu sync.Mutex
-
-	opts := RunOptions{
-		Args: []string{
-			"-i", input,
-			"-af", fmt.Sprintf("silencedetect=noise=%.6fdB:d=%.6f", noiseThreshold, minDuration),
-			"-f", "null",
-			"-",
-		},
-		LogHandler: func(line string) {
-			mu.Lock()
-			stderrBuf.WriteString(line + "\n")
-			mu.Unlock()
-			// Also log it for debugging
-			e.logger.Debug().Str("stderr", line).Msg("silence detection output")
-		},
+	args := []string{
+		"-i", input,
+		"-af", fmt.Sprintf("silencedetect=noise=%.6fdB:d=%.6f", noiseThreshold, minDuration),
 	}
-
-	err := e.Run(ctx, opts)
-
-	mu.Lock()
-	output := stderrBuf.String()
-	mu.Unlock()
-
-	// Log the full output for debugging
-	e.logger.Debug().Str("full_output", output).Msg("silence detection full stderr")
-
+	output, err := e.runNullAnalysis(ctx, "silence detection", args, silenceMarkers)
 	if err != nil {
-		// Check if it's a context cancellation - propagate that
-		if ctx.Err() != nil {
-			return nil, ctx.Err()
-		}
-		// Only ignore the specific null output errors
-		if !strings.Contains(err.Error(), "Conversion failed") &&
-			!strings.Contains(err.Error(), "Invalid return value") &&
-			!strings.Contains(err.Error(), "Output file is empty") {
-			return nil, fmt.Errorf("silence detection failed: %w", err)
-		}
-	}
-
-	if output == "" {
-		return nil, fmt.Errorf("silence detection produced no output")
+		return nil, err
 	}
 
 	return parseSilenceOutput(output), nil
@@ -129,35 +89,27 @@ func parseSilenceOutput(output string) []SilenceSegment {
 	var segments []SilenceSegment
 	var currentStart float64
 
-	lines := strings.Split(output, "\n")
-	for _, line := range lines {
-		if strings.Contains(line, "silence_start:") {
-			parts := strings.Split(line, "silence_start:")
-			if len(parts) == 2 {
-				currentStart, _ = strconv.ParseFloat(strings.TrimSpace(parts[1]), 64)
-			}
-		} else if strings.Contains(line, "silence_end:") {
-			parts := strings.Split(line, "silence_end:")
-			if len(parts) == 2 {
-				endStr := strings.Fields(strings.TrimSpace(parts[1]))[0]
-				end, _ := strconv.ParseFloat(endStr, 64)
-
-				var duration float64
-				if strings.Contains(line, "silence_duration:") {
-					durParts := strings.Split(line, "silence_duration:")
-					if len(durParts) == 2 {
-						duration, _ = strconv.ParseFloat(strings.TrimSpace(durParts[1]), 64)
-					}
-				} else {
-					duration = end - currentStart
-				}
-
-				segments = append(segments, SilenceSegment{
-					Start:    currentStart,
-					End:      end,
-					Duration: duration,
-				})
+	for output != "" {
+		var line string
+		line, output, _ = strings.Cut(output, "\n")
+
+		if startStr, ok := markerValue(line, "silence_start:"); ok {
+			currentStart, _ = strconv.ParseFloat(startStr, 64)
+		} else if endStr, ok := markerValue(line, "silence_end:"); ok {
+			end, _ := strconv.ParseFloat(endStr, 64)
+
+			var duration float64
+			if durStr, ok := markerValue(line, "silence_duration:"); ok {
+				duration, _ = strconv.ParseFloat(durStr, 64)
+			} else {
+				duration = end - currentStart
 			}
+
+			segments = append(segments, SilenceSegment{
+				Start:    currentStart,
+				End:      end,
+				Duration: duration,
+			})
 		}
 	}
 
@@ -174,71 +126,41 @@ type VolumeStats struct {
 func (e *Executor) AnalyzeVolume(ctx context.Context, input string) (*VolumeStats, error) {
 	e.logger.Info().Str("input", input).Msg("analyzing volume")
 
-	var stderrBuf bytes.Buffer
-	var mu sync.Mutex
-
-	opts := RunOptions{
-		Args: []string{
-			"-i", input,
-			"-af", "volumedetect",
-			"-f", "null",
-			"-",
-		},
-		LogHandler: func(line string) {
-			mu.Lock()
-			stderrBuf.WriteString(line + "\n")
-			mu.Unlock()
-			e.logger.Debug().Str("stderr", line).Msg("volume detection output")
-		},
+	args := []string{
+		"-i", input,
+		"-af", "volumedetect",
 	}
-
-	err := e.Run(ctx, opts)
-
-	mu.Lock()
-	output := stderrBuf.String()
-	mu.Unlock()
-
-	e.logger.Debug().Str("full_output", output).Msg("volume detection full stderr")
-
+	output, err := e.runNullAnalysis(ctx, "volume analysis", args, volumeMarkers)
 	if err != nil {
-		if ctx.Err() != nil {
-			return nil, ctx.Err()
-		}
-		if !strings.Contains(err.Error(), "Conversion failed") &&
-			!strings.Contains(err.Error(), "Invalid return value") &&
-			!strings.Contains(err.Error(), "Output file is empty") {
-			return nil, fmt.Errorf("volume analysis failed: %w", err)
-		}
-	}
-
-	if output == "" {
-		return nil, fmt.Errorf("volume analysis produced no output")
+		return nil, err
 	}
 
 	return e.parseVolumeOutput(output)
 }
 
-// parseVolumeOutput extracts volume stats from ffmpeg output
+// parseVolumeOutput extracts volume stats from ffmpeg output. Output without
+// a mean_volume line means volumedetect never ran, for example on an input
+// with no audio stream, and is an error rather than silent zero volume.
 func (e *Executor) parseVolumeOutput(output string) (*VolumeStats, error) {
 	stats := &VolumeStats{}
+	found := false
 
-	lines := strings.Split(output, "\n")
-	for _, line := range lines {
-		if strings.Contains(line, "mean_volume:") {
-			parts := strings.Split(line, "mean_volume:")
-			if len(parts) == 2 {
-				valStr := strings.Fields(strings.TrimSpace(parts[1]))[0]
-				stats.MeanVolume, _ = strconv.ParseFloat(valStr, 64)
-			}
-		} else if strings.Contains(line, "max_volume:") {
-			parts := strings.Split(line, "max_volume:")
-			if len(parts) == 2 {
-				valStr := strings.Fields(strings.TrimSpace(parts[1]))[0]
-				stats.MaxVolume, _ = strconv.ParseFloat(valStr, 64)
-			}
+	for output != "" {
+		var line string
+		line, output, _ = strings.Cut(output, "\n")
+
+		if valStr, ok := markerValue(line, "mean_volume:"); ok {
+			stats.MeanVolume, _ = strconv.ParseFloat(valStr, 64)
+			found = true
+		} else if valStr, ok := markerValue(line, "max_volume:"); ok {
+			stats.MaxVolume, _ = strconv.ParseFloat(valStr, 64)
 		}
 	}
 
+	if !found {
+		return nil, fmt.Errorf("volumedetect reported no mean_volume")
+	}
+
 	return stats, nil
 }
 
@@ -262,9 +184,7 @@ func (e *Executor) NormalizeAudio(ctx context.Context, input, output string, tar
 	opts := RunOptions{
 		Args:            args,
 		ProgressHandler: progressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("audio normalization")
-		},
+		LogHandler:      e.debugLogHandler("audio normalization"),
 	}
 
 	return e.Run(ctx, opts)
@@ -0,0 +1,319 @@
+package ffmpeg
+
+import (
+	"context"
+	"fmt"
+	"runtime"
+	"strings"
+	"sync"
+
+	"github.com/keagan/slopcannon/pkg/util"
+	"github.com/rs/zerolog"
+)
+
+// encodeThreadsPerJob is the encoder thread budget for each concurrent
+// re-encode, so parallel libx264 jobs split the cores rather than each
+// claiming all of them
+const encodeThreadsPerJob = 2
+
+// maxHardwareEncodes caps concurrent re-encodes on a hardware encoder.
+// Consumer GPUs limit how many encode sessions may be open at once, and
+// the encoder itself, not the CPU, is the bottleneck.
+const maxHardwareEncodes = 2
+
+// maxCopyWorkers caps the automatic stream-copy pool; beyond this, parallel
+// copies contend for the same disk rather than overlapping I/O
+const maxCopyWorkers = 16
+
+// ExtractClips cuts several segments from one input on bounded worker pools.
+// Stream copies are I/O-bound and run on a pool as wide as GOMAXPROCS
+// (at least 2, at most maxCopyWorkers), batched several outputs per process;
+// re-encodes share the CPUs at encodeThreadsPerJob threads each, or run at
+// most maxHardwareEncodes at a time on a hardware encoder. A positive
+// workers is instead the total number of concurrent ffmpeg processes, split
+// between the two pools, and software re-encodes without Threads divide the
+// CPUs among the encode workers. The first error cancels the remaining
+// extractions.
+func (e *Executor) ExtractClips(ctx context.Context, input string, clips []ClipOptions, workers int) error {
+	if len(clips) == 0 {
+		return nil
+	}
+
+	var copies, encodes []ClipOptions
+	for _, opts := range clips {
+		if opts.CopyCodec {
+			copies = append(copies, opts)
+		} else {
+			encodes = append(encodes, opts)
+		}
+	}
+
+	// Encodes without an explicit codec run on the hardware encoder, if any
+	hardware := false
+	for _, opts := range encodes {
+		if opts.VideoCodec == "" {
+			hardware = e.hardwareEncoder() != nil
+			break
+		}
+	}
+
+	// GOMAXPROCS defaults to NumCPU, which on Linux already counts only the
+	// CPUs in the affinity mask; it additionally honors an explicit
+	// GOMAXPROCS setting. Container CPU quotas are not applied on go 1.21.
+	copyWorkers, encodeWorkers, threads := poolSizes(runtime.GOMAXPROCS(0), workers, len(copies), len(encodes), hardware)
+	for i := range encodes {
+		// -threads only sizes software encoders
+		if encodes[i].Threads == 0 && !(hardware && encodes[i].VideoCodec == "") {
+			encodes[i].Threads = threads
+		}
+	}
+
+	e.logger.Info().
+		Str("input", input).
+		Int("copies", len(copies)).
+		Int("encodes", len(encodes)).
+		Int("copy_workers", copyWorkers).
+		Int("encode_workers", encodeWorkers).
+		Msg("extracting clips")
+
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	var once sync.Once
+	var firstErr error
+	fail := func(output string, err error) {
+		once.Do(func() {
+			firstErr = fmt.Errorf("%s: %w", output, err)
+			cancel()
+		})
+	}
+
+	runCopies := func() {
+		e.extractPool(ctx, input, batchCopies(copies, copyWorkers), copyWorkers, fail)
+	}
+	runEncodes := func() {
+		e.extractPool(ctx, input, singleBatches(encodes), encodeWorkers, fail)
+	}
+
+	if workers == 1 {
+		// A budget of one process runs the pools back to back
+		runCopies()
+		runEncodes()
+	} else {
+		var wg sync.WaitGroup
+		wg.Add(2)
+		go func() {
+			defer wg.Done()
+			runCopies()
+		}()
+		go func() {
+			defer wg.Done()
+			runEncodes()
+		}()
+		wg.Wait()
+	}
+
+	if firstErr != nil {
+		return firstErr
+	}
+	if err := ctx.Err(); err != nil {
+		return err
+	}
+
+	e.logger.Info().Int("clips", len(clips)).Msg("clip extraction complete")
+	return nil
+}
+
+// poolSizes returns the copy and encode pool widths and the CPU thread
+// budget of each software re-encode, for cpus usable CPUs and a workers
+// budget as in ExtractClips. hardware caps the encode pool at
+// maxHardwareEncodes.
+func poolSizes(cpus, workers, copies, encodes int, hardware bool) (copyWorkers, encodeWorkers, threads int) {
+	threads = encodeThreadsPerJob
+	if workers <= 0 {
+		copyWorkers = min(max(cpus, 2), maxCopyWorkers)
+		encodeWorkers = max(cpus/encodeThreadsPerJob, 1)
+	} else {
+		copyWorkers, encodeWorkers = splitWorkers(workers, copies, encodes)
+		if encodeWorkers > 0 {
+			threads = max(cpus/encodeWorkers, 1)
+		}
+	}
+	if hardware {
+		encodeWorkers = min(encodeWorkers, maxHardwareEncodes)
+	}
+	return copyWorkers, encodeWorkers, threads
+}
+
+// splitWorkers divides a budget of total concurrent processes between the
+// copy and encode pools in proportion to their clip counts. Each non-empty
+// pool gets at least one worker; with a budget of one, both get one and
+// ExtractClips runs them sequentially.
+func splitWorkers(total, copies, encodes int) (copyWorkers, encodeWorkers int) {
+	switch {
+	case copies == 0:
+		return 0, total
+	case encodes == 0:
+		return total, 0
+	case total < 2:
+		return 1, 1
+	}
+
+	copyWorkers = total * copies / (copies + encodes)
+	copyWorkers = min(max(copyWorkers, 1), total-1)
+	return copyWorkers, total - copyWorkers
+}
+
+// maxCopyBatch caps how many stream copies share one ffmpeg process
+const maxCopyBatch = 16
+
+// batchCopies groups plain stream copies so each worker runs one ffmpeg
+// with several outputs instead of one process per clip. Clips with their
+// own progress callback or audio output keep a dedicated invocation.
+func batchCopies(copies []ClipOptions, workers int) [][]ClipOptions {
+	var plain []ClipOptions
+	var batches [][]ClipOptions
+	for _, opts := range copies {
+		if opts.ProgressFunc != nil || opts.AudioOutput != "" {
+			batches = append(batches, []ClipOptions{opts})
+			continue
+		}
+		plain = append(plain, opts)
+	}
+	if len(plain) == 0 {
+		return batches
+	}
+
+	if workers < 1 {
+		workers = 1
+	}
+	size := (len(plain) + workers - 1) / workers
+	if size > maxCopyBatch {
+		size = maxCopyBatch
+	}
+	for len(plain) > 0 {
+		n := size
+		if n > len(plain) {
+			n = len(plain)
+		}
+		batches = append(batches, plain[:n:n])
+		plain = plain[n:]
+	}
+	return batches
+}
+
+// singleBatches wraps each clip in its own batch
+func singleBatches(clips []ClipOptions) [][]ClipOptions {
+	batches := make([][]ClipOptions, len(clips))
+	for i := range clips {
+		batches[i] = clips[i : i+1 : i+1]
+	}
+	return batches
+}
+
+// extractPool runs each batch on up to workers goroutines
+func (e *Executor) extractPool(ctx context.Context, input string, batches [][]ClipOptions, workers int, fail func(string, error)) {
+	if len(batches) == 0 {
+		return
+	}
+	if workers < 1 {
+		workers = 1
+	}
+	if workers > len(batches) {
+		workers = len(batches)
+	}
+
+	jobs := make(chan []ClipOptions)
+	var wg sync.WaitGroup
+
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for batch := range jobs {
+				if len(batch) == 1 {
+					if err := e.extractClip(ctx, input, batch[0], zerolog.DebugLevel); err != nil {
+						fail(batch[0].Output, err)
+					}
+					continue
+				}
+				if err := e.extractCopyBatch(ctx, input, batch); err != nil {
+					fail(batchOutputs(batch), err)
+				}
+			}
+		}()
+	}
+
+	for _, batch := range batches {
+		if ctx.Err() != nil {
+			break
+		}
+		jobs <- batch
+	}
+	close(jobs)
+	wg.Wait()
+}
+
+// extractCopyBatch stream-copies several segments in one ffmpeg process.
+// Each segment opens the input with its own input-side seek, so cuts snap to
+// keyframes exactly as in ExtractClip, but only one process is spawned.
+func (e *Executor) extractCopyBatch(ctx context.Context, input string, clips []ClipOptions) error {
+	args, err := copyBatchArgs(input, clips)
+	if err != nil {
+		return err
+	}
+
+	e.logger.Debug().
+		Str("input", input).
+		Str("outputs", batchOutputs(clips)).
+		Msg("extracting clip batch")
+
+	runOpts := RunOptions{
+		Args:       args,
+		LogHandler: e.debugLogHandler("clip batch extraction"),
+	}
+
+	if err := e.Run(ctx, runOpts); err != nil {
+		return fmt.Errorf("clip batch extraction failed: %w", err)
+	}
+
+	e.logger.Debug().Int("clips", len(clips)).Msg("clip batch extraction complete")
+	return nil
+}
+
+// copyBatchArgs builds the arguments for one multi-output stream copy: one
+// seeked input per clip, then each output mapped to its own input's first
+// video and audio stream, either of which may be absent
+func copyBatchArgs(input string, clips []ClipOptions) ([]string, error) {
+	var args []string
+	for _, opts := range clips {
+		duration := opts.End - opts.Start
+		if duration <= 0 {
+			return nil, fmt.Errorf("invalid clip duration for %s: end must be after start", opts.Output)
+		}
+		args = append(args,
+			"-ss", util.FormatDuration(opts.Start),
+			"-t", util.FormatDuration(duration),
+			"-i", input,
+		)
+	}
+	for i, opts := range clips {
+		args = append(args,
+			"-map", fmt.Sprintf("%d:v:0?", i),
+			"-map", fmt.Sprintf("%d:a:0?", i),
+			"-c", copyCodec,
+			"-avoid_negative_ts", "make_zero",
+			opts.Output,
+		)
+	}
+	return args, nil
+}
+
+// batchOutputs names every output of a batch, for logs and errors
+func batchOutputs(clips []ClipOptions) string {
+	outputs := make([]string, len(clips))
+	for i, opts := range clips {
+		outputs[i] = opts.Output
+	}
+	return strings.Join(outputs, ", ")
+}
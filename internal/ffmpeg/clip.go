@@ -3,9 +3,11 @@ package ffmpeg
 import (
 	"context"
 	"fmt"
+	"strconv"
 	"time"
 
 	"github.com/keagan/slopcannon/pkg/util"
+	"github.com/rs/zerolog"
 )
 
 // ClipOptions defines clip extraction parameters
@@ -16,39 +18,55 @@ type ClipOptions struct {
 	CopyCodec    bool // If true, use -c copy for fast extraction
 	VideoCodec   string
 	AudioCodec   string
-	CRF          int // Quality (0-51, lower = better)
+	CRF          int    // Quality (0-51, lower = better)
+	Threads      int    // Encoder threads for re-encodes (0 = ffmpeg decides)
+	AudioOutput  string // Optional 16 kHz mono WAV of the same range, e.g. for transcription
 	ProgressFunc ProgressFunc
 }
 
+// Transcription audio format written to ClipOptions.AudioOutput
+const (
+	transcriptionSampleRate = "16000"
+	transcriptionChannels   = "1"
+)
+
 // ExtractClip cuts a segment from a video
 func (e *Executor) ExtractClip(ctx context.Context, input string, opts ClipOptions) error {
+	return e.extractClip(ctx, input, opts, zerolog.InfoLevel)
+}
+
+// extractClip cuts one segment, logging its start and completion at level.
+// ExtractClips passes debug so a large batch logs a summary, not every clip.
+func (e *Executor) extractClip(ctx context.Context, input string, opts ClipOptions, level zerolog.Level) error {
 	duration := opts.End - opts.Start
 	if duration <= 0 {
 		return fmt.Errorf("invalid clip duration: end must be after start")
 	}
 
-	e.logger.Info().
+	e.logger.WithLevel(level).
 		Str("input", input).
 		Str("output", opts.Output).
 		Dur("start", opts.Start).
 		Dur("duration", duration).
 		Bool("copy_codec", opts.CopyCodec).
+		Str("audio_output", opts.AudioOutput).
 		Msg("extracting clip")
 
+	// Input-side seek: the demuxer jumps to the nearest keyframe instead of
+	// decoding and discarding everything before Start. Re-encodes stay
+	// frame-accurate; stream copies snap to the keyframe. The window applies
+	// to every output.
 	args := []string{
-		"-i", input,
 		"-ss", util.FormatDuration(opts.Start),
 		"-t", util.FormatDuration(duration),
+		"-i", input,
 	}
 
 	if opts.CopyCodec {
-		args = append(args, "-c", "copy")
+		// Cuts land on keyframes; shift timestamps so the clip starts at zero
+		args = append(args, "-c", copyCodec, "-avoid_negative_ts", "make_zero")
 	} else {
-		codec := opts.VideoCodec
-		if codec == "" {
-			codec = DefaultVideoCodec
-		}
-		args = append(args, "-c:v", codec)
+		args = append(args, e.videoEncodeArgs(opts.VideoCodec, opts.CRF, "")...)
 
 		audioCodec := opts.AudioCodec
 		if audioCodec == "" {
@@ -56,28 +74,36 @@ func (e *Executor) ExtractClip(ctx context.Context, input string, opts ClipOptio
 		}
 		args = append(args, "-c:a", audioCodec)
 
-		crf := opts.CRF
-		if crf == 0 {
-			crf = DefaultCRF
+		if opts.Threads > 0 {
+			args = append(args, "-threads", strconv.Itoa(opts.Threads))
 		}
-		args = append(args, "-crf", fmt.Sprintf("%d", crf))
 	}
 
 	args = append(args, opts.Output)
 
+	// Second output from the same decode, so the audio isn't read twice
+	if opts.AudioOutput != "" {
+		args = append(args,
+			"-map", "0:a:0",
+			"-vn",
+			"-ac", transcriptionChannels,
+			"-ar", transcriptionSampleRate,
+			"-c:a", "pcm_s16le",
+			opts.AudioOutput,
+		)
+	}
+
 	runOpts := RunOptions{
 		Args:            args,
 		ProgressHandler: opts.ProgressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("clip extraction")
-		},
+		LogHandler:      e.debugLogHandler("clip extraction"),
 	}
 
 	if err := e.Run(ctx, runOpts); err != nil {
 		return fmt.Errorf("clip extraction failed: %w", err)
 	}
 
-	e.logger.Info().Str("output", opts.Output).Msg("clip extraction complete")
+	e.logger.WithLevel(level).Str("output", opts.Output).Msg("clip extraction complete")
 	return nil
 }
 
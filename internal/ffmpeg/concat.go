@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"strings"
 )
 
 // ConcatOptions defines concatenation parameters
@@ -46,23 +47,13 @@ func (e *Executor) Concat(ctx context.Context, opts ConcatOptions) error {
 	}
 
 	if opts.ReEncode {
-		codec := opts.VideoCodec
-		if codec == "" {
-			codec = DefaultVideoCodec
-		}
-		args = append(args, "-c:v", codec)
+		args = append(args, e.videoEncodeArgs(opts.VideoCodec, opts.CRF, "")...)
 
 		audioCodec := opts.AudioCodec
 		if audioCodec == "" {
 			audioCodec = DefaultAudioCodec
 		}
 		args = append(args, "-c:a", audioCodec)
-
-		crf := opts.CRF
-		if crf == 0 {
-			crf = DefaultCRF
-		}
-		args = append(args, "-crf", fmt.Sprintf("%d", crf))
 	} else {
 		args = append(args, "-c", "copy")
 	}
@@ -72,30 +63,39 @@ func (e *Executor) Concat(ctx context.Context, opts ConcatOptions) error {
 	runOpts := RunOptions{
 		Args:            args,
 		ProgressHandler: opts.ProgressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("concatenating")
-		},
+		LogHandler:      e.debugLogHandler("concatenating"),
 	}
 
 	return e.Run(ctx, runOpts)
 }
 
-// createConcatFile generates a temporary file list for ffmpeg concat
+// createConcatFile generates a temporary file list for ffmpeg concat.
+// The list is built in memory and written with a single call.
 func (e *Executor) createConcatFile(inputs []string) (string, error) {
-	tmpFile, err := os.CreateTemp("", "slopcannon-concat-*.txt")
-	if err != nil {
-		return "", err
-	}
-	defer tmpFile.Close()
-
+	var list strings.Builder
 	for _, input := range inputs {
 		absPath, err := filepath.Abs(input)
 		if err != nil {
 			return "", err
 		}
-		if _, err := fmt.Fprintf(tmpFile, "file '%s'\n", absPath); err != nil {
-			return "", err
-		}
+		// Quotes inside a quoted concat path are written as '\''
+		list.WriteString("file '")
+		list.WriteString(strings.ReplaceAll(absPath, "'", `'\''`))
+		list.WriteString("'\n")
+	}
+
+	tmpFile, err := os.CreateTemp("", "slopcannon-concat-*.txt")
+	if err != nil {
+		return "", err
+	}
+
+	_, err = tmpFile.WriteString(list.String())
+	if closeErr := tmpFile.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		os.Remove(tmpFile.Name())
+		return "", err
 	}
 
 	return tmpFile.Name(), nil
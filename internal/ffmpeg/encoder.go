@@ -0,0 +1,144 @@
+package ffmpeg
+
+import (
+	"context"
+	"os/exec"
+	"strconv"
+	"strings"
+	"time"
+)
+
+// hwEncoder describes a hardware H.264 encoder and how to map a CRF onto it
+type hwEncoder struct {
+	name        string
+	qualityArgs func(crf int) []string
+}
+
+// hwEncoders lists hardware encoders in order of preference.
+// None of them accept -crf, so each maps the CRF to its own quality control.
+var hwEncoders = []hwEncoder{
+	{"h264_nvenc", func(crf int) []string {
+		return []string{"-preset", "p4", "-rc", "vbr", "-cq", strconv.Itoa(crf)}
+	}},
+	{"h264_videotoolbox", func(int) []string {
+		return []string{"-b:v", "6M"}
+	}},
+	{"h264_qsv", func(crf int) []string {
+		return []string{"-global_quality", strconv.Itoa(crf)}
+	}},
+	{"h264_amf", func(crf int) []string {
+		q := strconv.Itoa(crf)
+		return []string{"-rc", "cqp", "-qp_i", q, "-qp_p", q}
+	}},
+}
+
+// encoderProbeTimeout bounds each one-off ffmpeg query made while picking an encoder
+const encoderProbeTimeout = 10 * time.Second
+
+// hardwareEncoder returns the preferred hardware encoder, or nil when
+// hardware encoding is disabled or none works. The ffmpeg build is queried
+// once per Executor.
+func (e *Executor) hardwareEncoder() *hwEncoder {
+	if !e.hwEncode {
+		return nil
+	}
+
+	e.encoderOnce.Do(func() {
+		available, err := e.listEncoders()
+		if err != nil {
+			e.logger.Warn().Err(err).Msg("failed to list ffmpeg encoders; using software encoding")
+			return
+		}
+
+		e.encoder = selectEncoder(hwEncoders, available, e.testEncoder)
+		if e.encoder == nil {
+			e.logger.Info().Msg("no working hardware video encoder; using software encoding")
+			return
+		}
+		e.logger.Info().Str("encoder", e.encoder.name).Msg("using hardware video encoder")
+	})
+
+	return e.encoder
+}
+
+// selectEncoder returns the first candidate that is compiled in and passes
+// works, or nil. A listed encoder may still lack its device or driver, so
+// the listing alone is not enough.
+func selectEncoder(candidates []hwEncoder, available map[string]bool, works func(name string) bool) *hwEncoder {
+	for i := range candidates {
+		if available[candidates[i].name] && works(candidates[i].name) {
+			return &candidates[i]
+		}
+	}
+	return nil
+}
+
+// listEncoders returns the encoder names compiled into the ffmpeg build
+func (e *Executor) listEncoders() (map[string]bool, error) {
+	ctx, cancel := context.WithTimeout(context.Background(), encoderProbeTimeout)
+	defer cancel()
+
+	output, err := exec.CommandContext(ctx, e.ffmpegPath, "-hide_banner", "-encoders").Output()
+	if err != nil {
+		return nil, err
+	}
+
+	available := make(map[string]bool)
+	for _, line := range strings.Split(string(output), "\n") {
+		// Encoder lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+		fields := strings.Fields(line)
+		if len(fields) >= 2 {
+			available[fields[1]] = true
+		}
+	}
+	return available, nil
+}
+
+// testEncoder reports whether name can encode a single synthetic frame
+func (e *Executor) testEncoder(name string) bool {
+	ctx, cancel := context.WithTimeout(context.Background(), encoderProbeTimeout)
+	defer cancel()
+
+	err := exec.CommandContext(ctx, e.ffmpegPath,
+		"-hide_banner", "-loglevel", "error",
+		"-f", "lavfi", "-i", "color=s=256x256",
+		"-frames:v", "1",
+		"-c:v", name,
+		"-f", "null", "-",
+	).Run()
+	if err != nil {
+		e.logger.Debug().Err(err).Str("encoder", name).Msg("hardware encoder test failed")
+		return false
+	}
+	return true
+}
+
+// videoEncodeArgs returns the -c:v and quality flags for a re-encode.
+// An explicit codec is used as given; otherwise a detected hardware encoder
+// replaces the libx264 default. preset only applies to libx264 and may be empty.
+func (e *Executor) videoEncodeArgs(codec string, crf int, preset string) []string {
+	if crf == 0 {
+		crf = DefaultCRF
+	}
+
+	if codec == "" {
+		if hw := e.hardwareEncoder(); hw != nil {
+			return append([]string{"-c:v", hw.name}, hw.qualityArgs(crf)...)
+		}
+		codec = DefaultVideoCodec
+	}
+
+	args := []string{"-c:v", codec, "-crf", strconv.Itoa(crf)}
+	if preset != "" {
+		args = append(args, "-preset", preset)
+	}
+	return args
+}
+
+// defaultEncodeArgs returns the video flags for the fixed-setting render paths
+func (e *Executor) defaultEncodeArgs() []string {
+	if e.hardwareEncoder() != nil {
+		return e.videoEncodeArgs("", DefaultCRF, "")
+	}
+	return defaultVideoEncodeArgs
+}
@@ -2,10 +2,15 @@ package ffmpeg
 
 import (
 	"bufio"
+	"bytes"
 	"context"
 	"fmt"
+	"image"
+	_ "image/jpeg"
 	"io"
 	"os/exec"
+	"path/filepath"
+	"strconv"
 	"strings"
 	"sync"
 	"time"
@@ -19,16 +24,47 @@ type Executor struct {
 	ffmpegPath  string
 	ffprobePath string
 	threads     int
+	hwaccel     string
+	hwEncode    bool
+	baseArgs    []string // global flags prepended to every Run
+
+	encoderOnce sync.Once
+	encoder     *hwEncoder // detected hardware encoder, nil = libx264
+
+	probeMu sync.Mutex
+	probes  map[string]*probeCall // ProbeVideo results by path
+}
+
+// Options configures an Executor
+type Options struct {
+	BinaryPath string // ffmpeg name or path; ffprobe is looked up beside it
+	Threads    int    // 0 = ffmpeg decides
+	HWAccel    string // -hwaccel method for analysis decodes ("" = software)
+	HWEncode   bool   // use a detected hardware H.264 encoder instead of libx264
 }
 
 // New creates a new ffmpeg executor
 func New(logger zerolog.Logger, threads int) (*Executor, error) {
-	ffmpegPath, err := exec.LookPath("ffmpeg")
+	return NewWithOptions(logger, Options{Threads: threads})
+}
+
+// NewWithOptions creates a new ffmpeg executor from Options
+func NewWithOptions(logger zerolog.Logger, opts Options) (*Executor, error) {
+	binary := opts.BinaryPath
+	if binary == "" {
+		binary = "ffmpeg"
+	}
+
+	// Resolve to absolute paths once so each spawn skips the PATH search
+	ffmpegPath, err := exec.LookPath(binary)
 	if err != nil {
 		return nil, fmt.Errorf("ffmpeg not found in PATH: %w", err)
 	}
+	if abs, err := filepath.Abs(ffmpegPath); err == nil {
+		ffmpegPath = abs
+	}
 
-	ffprobePath, err := exec.LookPath("ffprobe")
+	ffprobePath, err := findFFprobe(ffmpegPath)
 	if err != nil {
 		return nil, fmt.Errorf("ffprobe not found in PATH: %w", err)
 	}
@@ -37,25 +73,62 @@ func New(logger zerolog.Logger, threads int) (*Executor, error) {
 		logger:      logger.With().Str("component", "ffmpeg").Logger(),
 		ffmpegPath:  ffmpegPath,
 		ffprobePath: ffprobePath,
-		threads:     threads,
+		threads:     opts.Threads,
+		hwaccel:     opts.HWAccel,
+		hwEncode:    opts.HWEncode,
+		baseArgs:    buildBaseArgs(opts.Threads),
 	}, nil
 }
 
+// findFFprobe prefers the ffprobe installed next to ffmpeg, so a custom
+// ffmpeg build is paired with its own ffprobe, and falls back to PATH
+func findFFprobe(ffmpegPath string) (string, error) {
+	sibling := filepath.Join(filepath.Dir(ffmpegPath), "ffprobe"+filepath.Ext(ffmpegPath))
+	if path, err := exec.LookPath(sibling); err == nil {
+		return path, nil
+	}
+
+	path, err := exec.LookPath("ffprobe")
+	if err != nil {
+		return "", err
+	}
+	if abs, err := filepath.Abs(path); err == nil {
+		path = abs
+	}
+	return path, nil
+}
+
+// buildBaseArgs returns the global flags Run prepends to every invocation.
+// -nostats drops the periodic stats line from stderr; progress, when wanted,
+// is requested separately on stdout.
+func buildBaseArgs(threads int) []string {
+	args := []string{"-y", "-hide_banner", "-loglevel", "info", "-nostats"}
+	if threads > 0 {
+		args = append(args, "-threads", strconv.Itoa(threads))
+	}
+	return args
+}
+
+// progressArgs sends machine-readable key=value progress to stdout
+var progressArgs = []string{"-progress", "pipe:1"}
+
 // Run executes ffmpeg with the given arguments and streams progress
 func (e *Executor) Run(ctx context.Context, opts RunOptions) error {
 	if len(opts.Args) == 0 {
 		return fmt.Errorf("no arguments provided")
 	}
 
-	// Build args with threads BEFORE other arguments
-	baseArgs := []string{"-y", "-hide_banner", "-loglevel", "info"}
-
-	if e.threads > 0 {
-		baseArgs = append(baseArgs, "-threads", fmt.Sprintf("%d", e.threads))
+	// Global args (threads included) go BEFORE other arguments
+	baseArgs := e.baseArgs
+	if baseArgs == nil {
+		baseArgs = buildBaseArgs(e.threads)
 	}
-
-	baseArgs = append(baseArgs, "-progress", "pipe:2")
-	args := append(baseArgs, opts.Args...)
+	args := make([]string, 0, len(baseArgs)+len(progressArgs)+len(opts.Args))
+	args = append(args, baseArgs...)
+	if opts.ProgressHandler != nil {
+		args = append(args, progressArgs...)
+	}
+	args = append(args, opts.Args...)
 
 	e.logger.Debug().
 		Str("cmd", "ffmpeg").
@@ -69,34 +142,41 @@ func (e *Executor) Run(ctx context.Context, opts RunOptions) error {
 		return fmt.Errorf("failed to create stderr pipe: %w", err)
 	}
 
-	stdout, err := cmd.StdoutPipe()
-	if err != nil {
-		return fmt.Errorf("failed to create stdout pipe: %w", err)
+	// Without a progress handler stdout carries nothing and goes to the null device
+	var stdout io.ReadCloser
+	if opts.ProgressHandler != nil {
+		stdout, err = cmd.StdoutPipe()
+		if err != nil {
+			return fmt.Errorf("failed to create stdout pipe: %w", err)
+		}
 	}
 
 	if err := cmd.Start(); err != nil {
 		return fmt.Errorf("failed to start ffmpeg: %w", err)
 	}
 
+	// Keep only the last few log lines for the error message
+	tail := newLineTail(stderrTailLines)
 	var wg sync.WaitGroup
-	wg.Add(2)
-
-	// Stream stderr (progress + logs)
-	go func() {
-		defer wg.Done()
-		e.streamOutput(stderr, opts.ProgressHandler, opts.LogHandler)
-	}()
-
-	// Stream stdout
-	go func() {
-		defer wg.Done()
-		scanner := bufio.NewScanner(stdout)
-		for scanner.Scan() {
-			if opts.LogHandler != nil {
-				opts.LogHandler(scanner.Text())
-			}
+
+	// Stream stdout (progress)
+	if stdout != nil {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			e.streamOutput(stdout, opts.ProgressHandler, nil)
+		}()
+	}
+
+	// Stream stderr (logs)
+	scanner := bufio.NewScanner(stderr)
+	for scanner.Scan() {
+		line := scanner.Text()
+		tail.add(line)
+		if opts.LogHandler != nil {
+			opts.LogHandler(line)
 		}
-	}()
+	}
 
 	wg.Wait()
 
@@ -104,17 +184,38 @@ func (e *Executor) Run(ctx context.Context, opts RunOptions) error {
 		if ctx.Err() == context.Canceled {
 			return ctx.Err()
 		}
-		return fmt.Errorf("ffmpeg execution failed: %w", err)
+		return fmt.Errorf("ffmpeg execution failed: %w\n%s", err, tail.String())
 	}
 
 	e.logger.Debug().Msg("ffmpeg execution completed")
 	return nil
 }
 
-// streamOutput parses ffmpeg output and calls handlers
+// debugEnabled reports whether debug events would be written
+func (e *Executor) debugEnabled() bool {
+	return e.logger.GetLevel() <= zerolog.DebugLevel && zerolog.GlobalLevel() <= zerolog.DebugLevel
+}
+
+// debugLogHandler returns a LogHandler logging each ffmpeg line at debug
+// level under msg. It returns nil when debug logging is off, so Run does not
+// call back per line just to discard it.
+func (e *Executor) debugLogHandler(msg string) func(string) {
+	if !e.debugEnabled() {
+		return nil
+	}
+	return func(line string) {
+		e.logger.Debug().Str("ffmpeg", line).Msg(msg)
+	}
+}
+
+// streamOutput parses ffmpeg output and calls handlers.
+// Progress blocks that repeat the previous frame count (a stalled or paused
+// encode) are not re-delivered, except the final progress=end block, and
+// parsing is skipped without a handler.
 func (e *Executor) streamOutput(r io.Reader, progressHandler func(*Progress), logHandler func(string)) {
 	scanner := bufio.NewScanner(r)
 	progressData := &Progress{}
+	lastFrame := -1
 
 	for scanner.Scan() {
 		line := scanner.Text()
@@ -123,32 +224,41 @@ func (e *Executor) streamOutput(r io.Reader, progressHandler func(*Progress), lo
 			logHandler(line)
 		}
 
-		// Parse progress lines
-		if strings.HasPrefix(line, "frame=") {
-			fmt.Sscanf(line, "frame=%d", &progressData.Frame)
-		} else if strings.HasPrefix(line, "fps=") {
-			fmt.Sscanf(line, "fps=%f", &progressData.FPS)
-		} else if strings.HasPrefix(line, "bitrate=") {
-			parts := strings.SplitN(line, "=", 2)
-			if len(parts) == 2 {
-				progressData.Bitrate = strings.TrimSpace(parts[1])
-			}
-		} else if strings.HasPrefix(line, "time=") {
-			parts := strings.SplitN(line, "=", 2)
-			if len(parts) == 2 {
-				progressData.Time = strings.TrimSpace(parts[1])
+		if progressHandler == nil {
+			continue
+		}
+
+		// Parse progress lines (key=value)
+		key, value, ok := strings.Cut(line, "=")
+		if !ok {
+			continue
+		}
+		switch key {
+		case "frame":
+			if frame, err := strconv.Atoi(strings.TrimSpace(value)); err == nil {
+				progressData.Frame = frame
 			}
-		} else if strings.HasPrefix(line, "speed=") {
-			parts := strings.SplitN(line, "=", 2)
-			if len(parts) == 2 {
-				progressData.Speed = strings.TrimSpace(parts[1])
+		case "fps":
+			if fps, err := strconv.ParseFloat(strings.TrimSpace(value), 64); err == nil {
+				progressData.FPS = fps
 			}
-		} else if strings.HasPrefix(line, "progress=") {
-			// End of progress block
-			if progressHandler != nil && progressData.Frame > 0 {
+		case "bitrate":
+			progressData.Bitrate = strings.TrimSpace(value)
+		case "out_time":
+			progressData.Time = strings.TrimSpace(value)
+		case "speed":
+			progressData.Speed = strings.TrimSpace(value)
+		case "progress":
+			// End of progress block; the final one always carries the
+			// closing time and speed, even if no new frames were encoded
+			final := strings.TrimSpace(value) == "end"
+			if final || (progressData.Frame > 0 && progressData.Frame != lastFrame) {
 				progressHandler(progressData)
+				lastFrame = progressData.Frame
+				progressData = &Progress{}
+			} else {
+				*progressData = Progress{}
 			}
-			progressData = &Progress{}
 		}
 	}
 }
@@ -178,3 +288,46 @@ func (e *Executor) ExtractFrame(ctx context.Context, videoPath string, timestamp
 
 	return nil
 }
+
+// ExtractFrameImage decodes a single frame at the specified time in memory.
+// The frame is piped from ffmpeg as JPEG, avoiding a temp file round trip.
+// Seeking is inexact: the nearest preceding keyframe is returned rather than
+// decoding every frame up to the timestamp, which is plenty for scoring.
+func (e *Executor) ExtractFrameImage(ctx context.Context, videoPath string, timestamp time.Duration) (image.Image, error) {
+	args := []string{
+		"-hide_banner",
+		"-loglevel", "error",
+		"-noaccurate_seek",
+		"-ss", fmt.Sprintf("%.3f", timestamp.Seconds()),
+		"-i", videoPath,
+		"-vframes", "1",
+		"-f", "image2pipe",
+		"-c:v", "mjpeg",
+		"-q:v", "2",
+		"-",
+	}
+
+	e.logger.Debug().
+		Str("video", videoPath).
+		Dur("timestamp", timestamp).
+		Msg("extracting frame to memory")
+
+	var stdout, stderr bytes.Buffer
+	cmd := exec.CommandContext(ctx, e.ffmpegPath, args...)
+	cmd.Stdout = &stdout
+	cmd.Stderr = &stderr
+
+	if err := cmd.Run(); err != nil {
+		return nil, fmt.Errorf("frame extraction failed: %w: %s", err, strings.TrimSpace(stderr.String()))
+	}
+	if stdout.Len() == 0 {
+		return nil, fmt.Errorf("frame extraction produced no image")
+	}
+
+	img, _, err := image.Decode(&stdout)
+	if err != nil {
+		return nil, fmt.Errorf("failed to decode frame: %w", err)
+	}
+
+	return img, nil
+}
@@ -6,7 +6,9 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"runtime"
 	"strings"
+	"sync"
 	"testing"
 	"time"
 
@@ -188,6 +190,335 @@ func TestFilterBuilderChaining(t *testing.T) {
 	}
 }
 
+// progressBlock renders one block of ffmpeg -progress output at outTime
+func progressBlock(frame int, outTime time.Duration, speed, state string) string {
+	us := outTime.Microseconds()
+	return strings.Join([]string{
+		fmt.Sprintf("frame=%d", frame),
+		"fps=30.00",
+		"stream_0_0_q=28.0",
+		"bitrate= 512.3kbits/s",
+		"total_size=86016",
+		fmt.Sprintf("out_time_us=%d", us),
+		fmt.Sprintf("out_time_ms=%d", us),
+		fmt.Sprintf("out_time=%02d:%02d:%02d.%06d", us/3600e6, us/60e6%60, us/1e6%60, us%1e6),
+		"dup_frames=0",
+		"drop_frames=0",
+		"speed=" + speed,
+		"progress=" + state,
+	}, "\n")
+}
+
+func TestStreamOutputSkipsRepeatedProgress(t *testing.T) {
+	exec := &Executor{logger: zerolog.New(os.Stderr)}
+	output := strings.Join([]string{
+		progressBlock(10, 333333*time.Microsecond, "1.0x", "continue"),
+		progressBlock(10, 333333*time.Microsecond, "0.5x", "continue"),
+		progressBlock(25, 833333*time.Microsecond, "1.2x", "end"),
+	}, "\n")
+
+	var frames []int
+	exec.streamOutput(strings.NewReader(output), func(p *Progress) {
+		frames = append(frames, p.Frame)
+	}, nil)
+
+	if len(frames) != 2 || frames[0] != 10 || frames[1] != 25 {
+		t.Errorf("expected progress for frames [10 25], got %v", frames)
+	}
+
+	// The final block is delivered even when it repeats the frame count
+	output = strings.Join([]string{
+		progressBlock(40, 1300*time.Millisecond, "2.4x", "continue"),
+		progressBlock(40, 1333333*time.Microsecond, "2.5x", "end"),
+	}, "\n")
+
+	var final []*Progress
+	exec.streamOutput(strings.NewReader(output), func(p *Progress) {
+		final = append(final, p)
+	}, nil)
+
+	if len(final) != 2 || final[1].Time != "00:00:01.333333" || final[1].Speed != "2.5x" || final[1].Bitrate != "512.3kbits/s" {
+		t.Errorf("expected the progress=end block to be delivered, got %d blocks", len(final))
+	}
+}
+
+func TestLineTailKeepsMostRecent(t *testing.T) {
+	tail := newLineTail(3)
+	for _, line := range []string{"a", "b", "c", "d", "e"} {
+		tail.add(line)
+	}
+
+	if got := tail.String(); got != "c\nd\ne" {
+		t.Errorf("expected last three lines, got %q", got)
+	}
+}
+
+func TestEscapeSubtitlePath(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("expected value uses a POSIX absolute path")
+	}
+
+	got := escapeSubtitlePath("/tmp/a:b's [1],x;y.ass")
+	want := `filename=/tmp/a\\:b\\\'s \[1\]\,x\;y.ass`
+	if got != want {
+		t.Errorf("escapeSubtitlePath() = %s, want %s", got, want)
+	}
+}
+
+func TestParseSilenceOutput(t *testing.T) {
+	output := "[silencedetect @ 0x1] silence_start: 1.5\n" +
+		"[silencedetect @ 0x1] silence_end: 3.25 | silence_duration: 1.75\n" +
+		"[silencedetect @ 0x1] silence_start: 10\n" +
+		"[silencedetect @ 0x1] silence_end: 12 | silence_duration:\n"
+
+	segments := parseSilenceOutput(output)
+	want := []SilenceSegment{
+		{Start: 1.5, End: 3.25, Duration: 1.75},
+		{Start: 10, End: 12, Duration: 2},
+	}
+	if len(segments) != len(want) {
+		t.Fatalf("expected %d segments, got %v", len(want), segments)
+	}
+	for i := range want {
+		if segments[i] != want[i] {
+			t.Errorf("segment %d = %+v, want %+v", i, segments[i], want[i])
+		}
+	}
+}
+
+func TestParseVolumeOutput(t *testing.T) {
+	exec := &Executor{logger: zerolog.New(os.Stderr)}
+	output := "[Parsed_volumedetect_0 @ 0x1] mean_volume: -20.5 dB\n" +
+		"[Parsed_volumedetect_0 @ 0x1] max_volume: -3.0 dB\n"
+
+	stats, err := exec.parseVolumeOutput(output)
+	if err != nil {
+		t.Fatalf("parseVolumeOutput failed: %v", err)
+	}
+	if stats.MeanVolume != -20.5 || stats.MaxVolume != -3 {
+		t.Errorf("expected -20.5/-3 dB, got %+v", stats)
+	}
+
+	// A pass where volumedetect printed nothing must not read as silence
+	if _, err := exec.parseVolumeOutput("[Parsed_showinfo_2 @ 0x1] n:0 pts_time:1.5\n"); err == nil {
+		t.Error("expected an error when mean_volume is missing")
+	}
+}
+
+func TestAnalysisFingerprint(t *testing.T) {
+	opts := AnalysisOptions{SceneThreshold: 0.4, SilenceThreshold: -30, MinSilenceDuration: 1}
+	software := &Executor{}
+	cuda := &Executor{hwaccel: "cuda"}
+
+	if software.AnalysisFingerprint(opts) == cuda.AnalysisFingerprint(opts) {
+		t.Error("expected hwaccel to change the fingerprint")
+	}
+	changed := opts
+	changed.SceneThreshold = 0.5
+	if software.AnalysisFingerprint(opts) == software.AnalysisFingerprint(changed) {
+		t.Error("expected the scene threshold to change the fingerprint")
+	}
+	if !strings.Contains(software.AnalysisFingerprint(opts), fmt.Sprintf("scale=%d:", sceneAnalysisWidth)) {
+		t.Error("expected the fingerprint to cover the analysis scale")
+	}
+}
+
+func TestCountDecodeErrors(t *testing.T) {
+	output := "[Parsed_showinfo_2 @ 0x1] n:0 pts_time:1.5\n" +
+		"[h264 @ 0x2] error while decoding MB 12 7, bytestream -5\n" +
+		"[vist#0:0/h264 @ 0x3] Error while decoding stream #0:0: Invalid data found when processing input\n"
+
+	if got := countMarkerLines(output, decodeErrorMarkers); got != 2 {
+		t.Errorf("expected 2 decode error lines, got %d", got)
+	}
+}
+
+func TestSelectEncoder(t *testing.T) {
+	candidates := []hwEncoder{{name: "h264_nvenc"}, {name: "h264_qsv"}, {name: "h264_amf"}}
+
+	tests := []struct {
+		name      string
+		available []string
+		working   []string
+		want      string
+	}{
+		{"listed but broken is skipped", []string{"h264_nvenc", "h264_qsv"}, []string{"h264_qsv"}, "h264_qsv"},
+		{"preference order wins", []string{"h264_nvenc", "h264_qsv"}, []string{"h264_nvenc", "h264_qsv"}, "h264_nvenc"},
+		{"working but not listed is skipped", []string{"h264_qsv"}, []string{"h264_nvenc"}, ""},
+		{"none working falls back", []string{"h264_nvenc", "h264_qsv", "h264_amf"}, nil, ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			available := make(map[string]bool)
+			for _, name := range tt.available {
+				available[name] = true
+			}
+			var tested []string
+			works := func(name string) bool {
+				tested = append(tested, name)
+				for _, w := range tt.working {
+					if w == name {
+						return true
+					}
+				}
+				return false
+			}
+
+			got := selectEncoder(candidates, available, works)
+			gotName := ""
+			if got != nil {
+				gotName = got.name
+			}
+			if gotName != tt.want {
+				t.Errorf("selectEncoder() = %q, want %q", gotName, tt.want)
+			}
+			for _, name := range tested {
+				if !available[name] {
+					t.Errorf("test-encoded %q, which is not compiled in", name)
+				}
+			}
+		})
+	}
+}
+
+func TestSplitWorkers(t *testing.T) {
+	tests := []struct {
+		total, copies, encodes int
+		wantCopy, wantEncode   int
+	}{
+		{4, 0, 5, 0, 4},
+		{4, 5, 0, 4, 0},
+		{4, 2, 2, 2, 2},
+		{4, 9, 1, 3, 1},
+		{4, 1, 9, 1, 3},
+		{2, 10, 10, 1, 1},
+		{1, 3, 3, 1, 1},
+	}
+
+	for _, tt := range tests {
+		gotCopy, gotEncode := splitWorkers(tt.total, tt.copies, tt.encodes)
+		if gotCopy != tt.wantCopy || gotEncode != tt.wantEncode {
+			t.Errorf("splitWorkers(%d, %d, %d) = (%d, %d), want (%d, %d)",
+				tt.total, tt.copies, tt.encodes, gotCopy, gotEncode, tt.wantCopy, tt.wantEncode)
+		}
+		if tt.total > 1 && gotCopy+gotEncode > tt.total {
+			t.Errorf("splitWorkers(%d, %d, %d) exceeds the budget", tt.total, tt.copies, tt.encodes)
+		}
+	}
+}
+
+func TestPoolSizes(t *testing.T) {
+	tests := []struct {
+		cpus, workers, copies, encodes int
+		hardware                       bool
+		wantCopy, wantEncode, wantThr  int
+	}{
+		{16, 0, 4, 4, false, 16, 8, encodeThreadsPerJob},
+		{16, 0, 4, 4, true, 16, maxHardwareEncodes, encodeThreadsPerJob},
+		{1, 0, 0, 4, false, 2, 1, encodeThreadsPerJob},
+		{16, 8, 0, 4, false, 0, 8, 2},
+		{16, 8, 0, 4, true, 0, maxHardwareEncodes, 2},
+		{16, 1, 0, 4, true, 0, 1, 16},
+	}
+
+	for _, tt := range tests {
+		gotCopy, gotEncode, gotThr := poolSizes(tt.cpus, tt.workers, tt.copies, tt.encodes, tt.hardware)
+		if gotCopy != tt.wantCopy || gotEncode != tt.wantEncode || gotThr != tt.wantThr {
+			t.Errorf("poolSizes(%d, %d, %d, %d, %v) = (%d, %d, %d), want (%d, %d, %d)",
+				tt.cpus, tt.workers, tt.copies, tt.encodes, tt.hardware,
+				gotCopy, gotEncode, gotThr, tt.wantCopy, tt.wantEncode, tt.wantThr)
+		}
+	}
+}
+
+func TestBatchCopies(t *testing.T) {
+	plain := func(n int) []ClipOptions {
+		clips := make([]ClipOptions, n)
+		for i := range clips {
+			clips[i] = ClipOptions{Output: fmt.Sprintf("clip_%d.mp4", i), CopyCodec: true}
+		}
+		return clips
+	}
+
+	tests := []struct {
+		name      string
+		copies    []ClipOptions
+		workers   int
+		wantSizes []int
+	}{
+		{"split across workers", plain(10), 4, []int{3, 3, 3, 1}},
+		{"capped at maxCopyBatch", plain(40), 2, []int{16, 16, 8}},
+		{"zero workers is one pool", plain(5), 0, []int{5}},
+		{"empty", nil, 4, nil},
+		{
+			"progress and audio clips run alone",
+			append([]ClipOptions{
+				{Output: "progress.mp4", ProgressFunc: func(*Progress) {}},
+				{Output: "audio.mp4", AudioOutput: "audio.wav"},
+			}, plain(4)...),
+			2,
+			[]int{1, 1, 2, 2},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			batches := batchCopies(tt.copies, tt.workers)
+			var sizes []int
+			total := 0
+			for _, batch := range batches {
+				sizes = append(sizes, len(batch))
+				total += len(batch)
+			}
+			if fmt.Sprint(sizes) != fmt.Sprint(tt.wantSizes) {
+				t.Errorf("batch sizes = %v, want %v", sizes, tt.wantSizes)
+			}
+			if total != len(tt.copies) {
+				t.Errorf("batched %d clips, want %d", total, len(tt.copies))
+			}
+		})
+	}
+
+	batches := batchCopies([]ClipOptions{
+		{Output: "a.mp4"},
+		{Output: "progress.mp4", ProgressFunc: func(*Progress) {}},
+		{Output: "b.mp4"},
+	}, 1)
+	if len(batches) != 2 || batches[0][0].Output != "progress.mp4" {
+		t.Fatalf("expected the progress clip in its own batch, got %v", batches)
+	}
+	if got := batchOutputs(batches[1]); got != "a.mp4, b.mp4" {
+		t.Errorf("batchOutputs() = %q, want %q", got, "a.mp4, b.mp4")
+	}
+}
+
+func TestCopyBatchArgs(t *testing.T) {
+	clips := []ClipOptions{
+		{Start: 2 * time.Second, End: 5 * time.Second, Output: "a.mp4"},
+		{Start: 90 * time.Second, End: 100500 * time.Millisecond, Output: "b.mp4"},
+	}
+
+	args, err := copyBatchArgs("in.mp4", clips)
+	if err != nil {
+		t.Fatalf("copyBatchArgs() error: %v", err)
+	}
+
+	want := []string{
+		"-ss", "00:00:02.000", "-t", "00:00:03.000", "-i", "in.mp4",
+		"-ss", "00:01:30.000", "-t", "00:00:10.500", "-i", "in.mp4",
+		"-map", "0:v:0?", "-map", "0:a:0?", "-c", "copy", "-avoid_negative_ts", "make_zero", "a.mp4",
+		"-map", "1:v:0?", "-map", "1:a:0?", "-c", "copy", "-avoid_negative_ts", "make_zero", "b.mp4",
+	}
+	if strings.Join(args, " ") != strings.Join(want, " ") {
+		t.Errorf("copyBatchArgs() =\n%v\nwant\n%v", args, want)
+	}
+
+	if _, err := copyBatchArgs("in.mp4", []ClipOptions{{Start: time.Second, End: time.Second, Output: "c.mp4"}}); err == nil {
+		t.Error("expected an error for a zero-length clip")
+	}
+}
+
 func TestDetectScenes(t *testing.T) {
 	skipIfNoFFmpeg(t)
 
@@ -306,6 +637,173 @@ func TestAnalyzeVolume(t *testing.T) {
 	}
 }
 
+// fakeProbeExecutor returns an Executor whose ffprobe is a script that
+// logs each run to the returned file, sleeps delay, then prints metadata
+func fakeProbeExecutor(t *testing.T, delay time.Duration) (*Executor, string) {
+	t.Helper()
+	if runtime.GOOS == "windows" {
+		t.Skip("fake ffprobe is a shell script")
+	}
+
+	dir := t.TempDir()
+	runs := filepath.Join(dir, "runs")
+	script := filepath.Join(dir, "ffprobe")
+	body := fmt.Sprintf("#!/bin/sh\necho run >> %q\nsleep %.3f\n"+
+		"echo '{\"format\":{\"duration\":\"2.5\"},\"streams\":[{\"codec_type\":\"video\",\"width\":320,\"height\":240}]}'\n",
+		runs, delay.Seconds())
+	if err := os.WriteFile(script, []byte(body), 0755); err != nil {
+		t.Fatalf("failed to write fake ffprobe: %v", err)
+	}
+
+	return &Executor{logger: zerolog.Nop(), ffprobePath: script}, runs
+}
+
+// probeRuns counts the fake ffprobe invocations logged so far
+func probeRuns(t *testing.T, runs string) int {
+	t.Helper()
+	data, err := os.ReadFile(runs)
+	if os.IsNotExist(err) {
+		return 0
+	}
+	if err != nil {
+		t.Fatalf("failed to read probe log: %v", err)
+	}
+	return strings.Count(string(data), "\n")
+}
+
+func TestProbeVideoCacheKeyedByVersion(t *testing.T) {
+	exec, runs := fakeProbeExecutor(t, 0)
+	video := filepath.Join(t.TempDir(), "in.mp4")
+	if err := os.WriteFile(video, []byte("v1"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	ctx := context.Background()
+
+	probe := func(want int, why string) {
+		t.Helper()
+		info, err := exec.ProbeVideo(ctx, video)
+		if err != nil {
+			t.Fatalf("ProbeVideo failed: %v", err)
+		}
+		if info.Duration != 2500*time.Millisecond || info.Width != 320 {
+			t.Fatalf("unexpected probe result %+v", info)
+		}
+		if got := probeRuns(t, runs); got != want {
+			t.Fatalf("%s: expected %d ffprobe runs, got %d", why, want, got)
+		}
+	}
+
+	probe(1, "first probe")
+	probe(1, "unchanged file")
+
+	stamp := time.Now().Add(-time.Hour).Truncate(time.Second)
+	if err := os.Chtimes(video, stamp, stamp); err != nil {
+		t.Fatal(err)
+	}
+	probe(2, "changed mtime")
+
+	// Same mtime, different size
+	if err := os.WriteFile(video, []byte("v2 longer"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Chtimes(video, stamp, stamp); err != nil {
+		t.Fatal(err)
+	}
+	probe(3, "changed size")
+}
+
+func TestProbeVideoSharesInFlightCall(t *testing.T) {
+	exec, runs := fakeProbeExecutor(t, 200*time.Millisecond)
+	video := filepath.Join(t.TempDir(), "in.mp4")
+	if err := os.WriteFile(video, []byte("v1"), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	const callers = 5
+	var wg sync.WaitGroup
+	errs := make(chan error, callers)
+	for i := 0; i < callers; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			_, err := exec.ProbeVideo(context.Background(), video)
+			errs <- err
+		}()
+	}
+	wg.Wait()
+	close(errs)
+
+	for err := range errs {
+		if err != nil {
+			t.Fatalf("ProbeVideo failed: %v", err)
+		}
+	}
+	if got := probeRuns(t, runs); got != 1 {
+		t.Errorf("expected concurrent probes to share one ffprobe run, got %d", got)
+	}
+}
+
+func TestProbeVideoCanceledCallerDoesNotPoisonWaiters(t *testing.T) {
+	exec, runs := fakeProbeExecutor(t, 200*time.Millisecond)
+	video := filepath.Join(t.TempDir(), "in.mp4")
+	if err := os.WriteFile(video, []byte("v1"), 0644); err != nil {
+		t.Fatal(err)
+	}
+
+	ctx, cancel := context.WithCancel(context.Background())
+	firstErr := make(chan error, 1)
+	go func() {
+		_, err := exec.ProbeVideo(ctx, video)
+		firstErr <- err
+	}()
+
+	// Join the waiters only once the first caller's ffprobe is running
+	deadline := time.Now().Add(5 * time.Second)
+	for probeRuns(t, runs) == 0 {
+		if time.Now().After(deadline) {
+			t.Fatal("first ffprobe run never started")
+		}
+		time.Sleep(5 * time.Millisecond)
+	}
+
+	const waiters = 3
+	var wg sync.WaitGroup
+	errs := make(chan error, waiters)
+	for i := 0; i < waiters; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			info, err := exec.ProbeVideo(context.Background(), video)
+			if err == nil && info.Duration != 2500*time.Millisecond {
+				err = fmt.Errorf("unexpected duration %v", info.Duration)
+			}
+			errs <- err
+		}()
+	}
+	time.Sleep(20 * time.Millisecond)
+	cancel()
+
+	if err := <-firstErr; err == nil {
+		t.Error("expected the canceled caller to fail")
+	}
+	wg.Wait()
+	close(errs)
+	for err := range errs {
+		if err != nil {
+			t.Errorf("waiter failed after the first caller was canceled: %v", err)
+		}
+	}
+
+	// The failed run is not cached; the next probe runs ffprobe again
+	before := probeRuns(t, runs)
+	if _, err := exec.ProbeVideo(context.Background(), video); err != nil {
+		t.Fatalf("ProbeVideo failed: %v", err)
+	}
+	if probeRuns(t, runs) > before+1 {
+		t.Error("expected at most one new ffprobe run")
+	}
+}
+
 func TestConcatValidation(t *testing.T) {
 	skipIfNoFFmpeg(t)
 
@@ -4,6 +4,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"os"
 	"os/exec"
 	"strconv"
 	"time"
@@ -11,12 +12,73 @@ import (
 	"github.com/keagan/slopcannon/pkg/util"
 )
 
-// ProbeVideo extracts metadata from a video file
+// probeCall is a cached or in-flight ffprobe run for one file version
+type probeCall struct {
+	done    chan struct{}
+	size    int64
+	modTime time.Time
+	info    *VideoInfo
+	err     error
+}
+
+// ProbeVideo extracts metadata from a video file.
+// Results are cached per path while the file's size and modification time
+// are unchanged, and concurrent probes of the same file share one ffprobe run.
 func (e *Executor) ProbeVideo(ctx context.Context, filePath string) (*VideoInfo, error) {
 	if filePath == "" {
 		return nil, fmt.Errorf("file path is required")
 	}
 
+	stat, err := os.Stat(filePath)
+	if err != nil {
+		// Let ffprobe report the failure
+		return e.probeVideo(ctx, filePath)
+	}
+
+	e.probeMu.Lock()
+	call, ok := e.probes[filePath]
+	if ok && call.size == stat.Size() && call.modTime.Equal(stat.ModTime()) {
+		e.probeMu.Unlock()
+
+		select {
+		case <-call.done:
+		case <-ctx.Done():
+			return nil, ctx.Err()
+		}
+		if call.err != nil {
+			// The shared run failed (possibly canceled by its caller); probe afresh
+			return e.probeVideo(ctx, filePath)
+		}
+		info := *call.info
+		return &info, nil
+	}
+
+	call = &probeCall{done: make(chan struct{}), size: stat.Size(), modTime: stat.ModTime()}
+	if e.probes == nil {
+		e.probes = make(map[string]*probeCall)
+	}
+	e.probes[filePath] = call
+	e.probeMu.Unlock()
+
+	call.info, call.err = e.probeVideo(ctx, filePath)
+	if call.err != nil {
+		e.probeMu.Lock()
+		if e.probes[filePath] == call {
+			delete(e.probes, filePath)
+		}
+		e.probeMu.Unlock()
+	}
+	close(call.done)
+
+	if call.err != nil {
+		return nil, call.err
+	}
+	info := *call.info
+	return &info, nil
+}
+
+// probeVideo runs ffprobe and parses its metadata without caching
+func (e *Executor) probeVideo(ctx context.Context, filePath string) (*VideoInfo, error) {
 	args := []string{
 		"-v", "quiet",
 		"-print_format", "json",
@@ -5,9 +5,19 @@ import (
 	"fmt"
 	"path/filepath"
 	"runtime"
+	"strconv"
 	"strings"
 )
 
+// defaultVideoEncodeArgs are the video encoder flags shared by the fixed-setting
+// render paths, built once instead of re-formatted on every call.
+// Callers must append to a fresh slice and never modify it.
+var defaultVideoEncodeArgs = []string{
+	"-c:v", DefaultVideoCodec,
+	"-crf", strconv.Itoa(DefaultCRF),
+	"-preset", DefaultPreset,
+}
+
 // Render performs a full video render with all specified options
 func (e *Executor) Render(ctx context.Context, opts RenderOptions) error {
 	if err := validateRenderOptions(opts); err != nil {
@@ -32,33 +42,32 @@ func (e *Executor) Render(ctx context.Context, opts RenderOptions) error {
 		args = append(args, "-vf", strings.Join(filters, ","))
 	}
 
-	// Video codec settings
-	videoCodec := opts.VideoCodec
-	if videoCodec == "" {
-		videoCodec = DefaultVideoCodec
-	}
-	args = append(args, "-c:v", videoCodec)
-
-	// Quality settings
-	crf := opts.CRF
-	if crf == 0 {
-		crf = DefaultCRF
-	}
-	args = append(args, "-crf", fmt.Sprintf("%d", crf))
-
-	// Preset
-	preset := opts.Preset
-	if preset == "" {
-		preset = DefaultPreset
-	}
-	args = append(args, "-preset", preset)
+	if isStreamCopy(opts) {
+		// Stream copy: no decode or encode, so quality settings don't apply
+		audioCodec := opts.AudioCodec
+		if audioCodec == "" {
+			audioCodec = copyCodec
+		}
+		args = append(args,
+			"-c:v", copyCodec,
+			"-c:a", audioCodec,
+			"-avoid_negative_ts", "make_zero",
+		)
+	} else {
+		// Video codec, quality and preset settings
+		preset := opts.Preset
+		if preset == "" {
+			preset = DefaultPreset
+		}
+		args = append(args, e.videoEncodeArgs(opts.VideoCodec, opts.CRF, preset)...)
 
-	// Audio codec settings
-	audioCodec := opts.AudioCodec
-	if audioCodec == "" {
-		audioCodec = DefaultAudioCodec
+		// Audio codec settings
+		audioCodec := opts.AudioCodec
+		if audioCodec == "" {
+			audioCodec = DefaultAudioCodec
+		}
+		args = append(args, "-c:a", audioCodec)
 	}
-	args = append(args, "-c:a", audioCodec)
 
 	// FPS conversion
 	if opts.FPS > 0 {
@@ -76,9 +85,7 @@ func (e *Executor) Render(ctx context.Context, opts RenderOptions) error {
 	runOpts := RunOptions{
 		Args:            args,
 		ProgressHandler: opts.ProgressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("render output")
-		},
+		LogHandler:      e.debugLogHandler("render output"),
 	}
 
 	if err := e.Run(ctx, runOpts); err != nil {
@@ -109,6 +116,7 @@ func (e *Executor) MergeWithOverlay(ctx context.Context, input, overlay, output
 	e.logger.Info().
 		Str("input", input).
 		Str("overlay", overlay).
+		Str("subtitles", overlayOpts.Subtitles).
 		Str("output", output).
 		Msg("merging with overlay")
 
@@ -142,21 +150,21 @@ func (e *Executor) MergeWithOverlay(ctx context.Context, input, overlay, output
 		}
 	}
 
+	// Burn subtitles into the composited frame rather than in a second encode
+	if overlayOpts.Subtitles != "" {
+		overlayFilter += ",subtitles=" + escapeSubtitlePath(overlayOpts.Subtitles)
+	}
+
 	args = append(args,
 		"-filter_complex", overlayFilter,
-		"-c:v", DefaultVideoCodec,
-		"-crf", fmt.Sprintf("%d", DefaultCRF),
-		"-preset", DefaultPreset,
-		"-c:a", "copy",
-		output,
 	)
+	args = append(args, e.defaultEncodeArgs()...)
+	args = append(args, "-c:a", "copy", output)
 
 	runOpts := RunOptions{
 		Args:            args,
 		ProgressHandler: progressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("overlay output")
-		},
+		LogHandler:      e.debugLogHandler("overlay output"),
 	}
 
 	if err := e.Run(ctx, runOpts); err != nil {
@@ -191,19 +199,14 @@ func (e *Executor) ApplySubtitles(ctx context.Context, input, subtitles, output
 	args := []string{
 		"-i", input,
 		"-vf", fmt.Sprintf("subtitles=%s", escapedPath),
-		"-c:v", DefaultVideoCodec,
-		"-crf", fmt.Sprintf("%d", DefaultCRF),
-		"-preset", DefaultPreset,
-		"-c:a", "copy",
-		output,
 	}
+	args = append(args, e.defaultEncodeArgs()...)
+	args = append(args, "-c:a", "copy", output)
 
 	runOpts := RunOptions{
 		Args:            args,
 		ProgressHandler: progressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("subtitle output")
-		},
+		LogHandler:      e.debugLogHandler("subtitle output"),
 	}
 
 	if err := e.Run(ctx, runOpts); err != nil {
@@ -235,19 +238,14 @@ func (e *Executor) RenderWithFilterBuilder(ctx context.Context, input, output st
 	args := []string{
 		"-i", input,
 		"-vf", strings.Join(filterChain.Filters, ","),
-		"-c:v", DefaultVideoCodec,
-		"-crf", fmt.Sprintf("%d", DefaultCRF),
-		"-preset", DefaultPreset,
-		"-c:a", DefaultAudioCodec,
-		output,
 	}
+	args = append(args, e.defaultEncodeArgs()...)
+	args = append(args, "-c:a", DefaultAudioCodec, output)
 
 	runOpts := RunOptions{
 		Args:            args,
 		ProgressHandler: progressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("filter builder output")
-		},
+		LogHandler:      e.debugLogHandler("filter builder output"),
 	}
 
 	if err := e.Run(ctx, runOpts); err != nil {
@@ -274,9 +272,17 @@ func validateRenderOptions(opts RenderOptions) error {
 	if opts.FPS < 0 {
 		return fmt.Errorf("FPS cannot be negative")
 	}
+	if isStreamCopy(opts) && (len(buildFilterChain(opts)) > 0 || opts.FPS > 0) {
+		return fmt.Errorf("stream copy cannot be combined with filters, scaling, subtitles or FPS conversion")
+	}
 	return nil
 }
 
+// isStreamCopy reports whether the render copies the video stream as-is
+func isStreamCopy(opts RenderOptions) bool {
+	return opts.VideoCodec == copyCodec
+}
+
 // buildFilterChain constructs the filter chain from render options
 func buildFilterChain(opts RenderOptions) []string {
 	var filters []string
@@ -300,7 +306,16 @@ func buildFilterChain(opts RenderOptions) []string {
 	return filters
 }
 
-// escapeSubtitlePath escapes the subtitle file path for ffmpeg filters
+// Escapers for the two levels a filter argument passes through: the filter's
+// own option parser, then the filtergraph parser
+var (
+	filterOptionEscaper = strings.NewReplacer(`\`, `\\`, `'`, `\'`, `:`, `\:`)
+	filterGraphEscaper  = strings.NewReplacer(`\`, `\\`, `'`, `\'`, `[`, `\[`, `]`, `\]`, `,`, `\,`, `;`, `\;`)
+)
+
+// escapeSubtitlePath returns the subtitles filter's filename= argument.
+// The absolute path is escaped for both parsing levels, so paths containing
+// quotes, colons, brackets, commas or semicolons reach the filter intact.
 func escapeSubtitlePath(path string) string {
 	// Convert to absolute path
 	absPath, err := filepath.Abs(path)
@@ -308,18 +323,10 @@ func escapeSubtitlePath(path string) string {
 		absPath = path
 	}
 
-	// Windows: Convert backslashes to forward slashes
+	// Windows: forward slashes avoid escaping every separator
 	if runtime.GOOS == "windows" {
 		absPath = strings.ReplaceAll(absPath, "\\", "/")
-		// Escape drive letter colon (C: -> C\:)
-		if len(absPath) >= 2 && absPath[1] == ':' {
-			absPath = absPath[0:1] + "\\:" + absPath[2:]
-		}
 	}
 
-	// Escape special characters for ffmpeg filter
-	escaped := strings.ReplaceAll(absPath, ":", "\\:")
-	escaped = strings.ReplaceAll(escaped, "'", "\\'")
-
-	return escaped
+	return "filename=" + filterGraphEscaper.Replace(filterOptionEscaper.Replace(absPath))
 }
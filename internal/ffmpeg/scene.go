@@ -1,12 +1,10 @@
 package ffmpeg
 
 import (
-	"bytes"
 	"context"
 	"fmt"
 	"strconv"
 	"strings"
-	"sync"
 	"time"
 
 	"github.com/keagan/slopcannon/pkg/util"
@@ -19,41 +17,13 @@ func (e *Executor) DetectScenes(ctx context.Context, input string, threshold flo
 		Float64("threshold", threshold).
 		Msg("detecting scene changes")
 
-	var stderrBuf bytes.Buffer
-	var mu sync.Mutex
-
-	opts := RunOptions{
-		Args: []string{
-			"-i", input,
-			"-vf", fmt.Sprintf("select='gt(scene,%f)',showinfo", threshold),
-			"-f", "null",
-			"-",
-		},
-		LogHandler: func(line string) {
-			mu.Lock()
-			stderrBuf.WriteString(line + "\n")
-			mu.Unlock()
-			e.logger.Debug().Str("stderr", line).Msg("scene detection output")
-		},
+	args := []string{
+		"-i", input,
+		"-vf", fmt.Sprintf("select='gt(scene,%f)',showinfo", threshold),
 	}
-
-	err := e.Run(ctx, opts)
-
-	mu.Lock()
-	output := stderrBuf.String()
-	mu.Unlock()
-
-	e.logger.Debug().Str("full_output", output).Msg("scene detection full stderr")
-
+	output, err := e.runNullAnalysis(ctx, "scene detection", args, sceneMarkers)
 	if err != nil {
-		if ctx.Err() != nil {
-			return nil, ctx.Err()
-		}
-		if !strings.Contains(err.Error(), "Conversion failed") &&
-			!strings.Contains(err.Error(), "Invalid return value") &&
-			!strings.Contains(err.Error(), "Output file is empty") {
-			return nil, fmt.Errorf("scene detection failed: %w", err)
-		}
+		return nil, err
 	}
 
 	scenes := parseSceneOutput(output)
@@ -65,15 +35,13 @@ func (e *Executor) DetectScenes(ctx context.Context, input string, threshold flo
 func parseSceneOutput(output string) []time.Duration {
 	var scenes []time.Duration
 
-	lines := strings.Split(output, "\n")
-	for _, line := range lines {
-		if strings.Contains(line, "pts_time:") {
-			parts := strings.Split(line, "pts_time:")
-			if len(parts) == 2 {
-				timeStr := strings.Fields(strings.TrimSpace(parts[1]))[0]
-				if seconds, err := strconv.ParseFloat(timeStr, 64); err == nil {
-					scenes = append(scenes, time.Duration(seconds*float64(time.Second)))
-				}
+	for output != "" {
+		var line string
+		line, output, _ = strings.Cut(output, "\n")
+
+		if timeStr, ok := markerValue(line, "pts_time:"); ok {
+			if seconds, err := strconv.ParseFloat(timeStr, 64); err == nil {
+				scenes = append(scenes, time.Duration(seconds*float64(time.Second)))
 			}
 		}
 	}
@@ -107,9 +75,7 @@ func (e *Executor) GenerateThumbnail(ctx context.Context, input, output string,
 	opts := RunOptions{
 		Args:            args,
 		ProgressHandler: progressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("thumbnail generation")
-		},
+		LogHandler:      e.debugLogHandler("thumbnail generation"),
 	}
 
 	return e.Run(ctx, opts)
@@ -140,9 +106,7 @@ func (e *Executor) GenerateThumbnails(ctx context.Context, input, outputPattern
 	opts := RunOptions{
 		Args:            args,
 		ProgressHandler: progressFunc,
-		LogHandler: func(line string) {
-			e.logger.Debug().Str("ffmpeg", line).Msg("thumbnails generation")
-		},
+		LogHandler:      e.debugLogHandler("thumbnails generation"),
 	}
 
 	return e.Run(ctx, opts)
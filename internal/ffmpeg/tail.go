@@ -0,0 +1,48 @@
+package ffmpeg
+
+import (
+	"strings"
+	"sync"
+)
+
+// stderrTailLines is how many log lines Run keeps for error reporting
+const stderrTailLines = 64
+
+// lineTail is a fixed-size ring of the most recent log lines.
+// It bounds the memory spent on diagnostics regardless of encode length.
+type lineTail struct {
+	mu    sync.Mutex
+	lines []string
+	next  int
+	full  bool
+}
+
+// newLineTail creates a ring holding up to size lines
+func newLineTail(size int) *lineTail {
+	return &lineTail{lines: make([]string, size)}
+}
+
+// add records a line, evicting the oldest when full
+func (t *lineTail) add(line string) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	t.lines[t.next] = line
+	t.next++
+	if t.next == len(t.lines) {
+		t.next = 0
+		t.full = true
+	}
+}
+
+// String returns the retained lines oldest first, newline separated
+func (t *lineTail) String() string {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	ordered := t.lines[:t.next]
+	if t.full {
+		ordered = append(append([]string{}, t.lines[t.next:]...), t.lines[:t.next]...)
+	}
+	return strings.Join(ordered, "\n")
+}
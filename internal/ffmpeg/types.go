@@ -23,6 +23,9 @@ type OverlayOptions struct {
 	Opacity float64
 	Start   time.Duration
 	End     time.Duration
+
+	// Subtitles, if set, are burned in after compositing in the same encode
+	Subtitles string
 }
 
 // Progress represents ffmpeg progress data
@@ -48,6 +51,9 @@ const (
 	DefaultPreset     = "medium"
 	DefaultVideoCodec = "libx264"
 	DefaultAudioCodec = "aac"
+
+	// copyCodec selects stream copy (no re-encode) in -c options
+	copyCodec = "copy"
 )
 
 // RenderOptions configures video rendering operations
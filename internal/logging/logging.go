@@ -1,14 +1,22 @@
 package logging
 
 import (
+	"bufio"
 	"io"
 	"os"
+	"sync"
 	"time"
 
 	"github.com/rs/zerolog"
 	"github.com/rs/zerolog/log"
 )
 
+// flushInterval bounds how long a buffered log line waits before reaching stderr
+const flushInterval = 10 * time.Millisecond
+
+// console is the buffered writer behind the global logger, flushed by Close
+var console *bufferedWriter
+
 // Init initializes the global logger
 func Init(verbose bool) {
 	zerolog.TimeFieldFormat = time.RFC3339
@@ -20,13 +28,123 @@ func Init(verbose bool) {
 
 	zerolog.SetGlobalLevel(level)
 
+	// Formatted events are batched into large stderr writes, so bursts of
+	// ffmpeg output cost few syscalls; nothing is dropped under load
+	buffered := newBufferedWriter(os.Stderr, flushInterval)
+	console = buffered
+
 	output := zerolog.ConsoleWriter{
-		Out:        os.Stderr,
+		Out:        buffered,
 		TimeFormat: "15:04:05",
 		NoColor:    false,
 	}
 
-	log.Logger = zerolog.New(output).With().Timestamp().Logger()
+	log.Logger = zerolog.New(levelFlusher{w: output, buffered: buffered}).With().Timestamp().Logger()
+}
+
+// Stderr returns a writer for output that bypasses the logger, such as
+// cobra's error messages. Pending log lines are flushed first, so they
+// reach the terminal before whatever is written after them.
+func Stderr() io.Writer {
+	return stderrWriter{}
+}
+
+// stderrWriter flushes the console buffer before each write to stderr
+type stderrWriter struct{}
+
+func (stderrWriter) Write(p []byte) (int, error) {
+	if console != nil {
+		console.flush()
+	}
+	return os.Stderr.Write(p)
+}
+
+// levelFlusher writes events to w and flushes buffered immediately after
+// any event at error level or above, so errors are never left waiting on
+// the timer when the process is about to exit
+type levelFlusher struct {
+	w        io.Writer
+	buffered *bufferedWriter
+}
+
+func (lf levelFlusher) Write(p []byte) (int, error) {
+	return lf.w.Write(p)
+}
+
+func (lf levelFlusher) WriteLevel(level zerolog.Level, p []byte) (int, error) {
+	n, err := lf.w.Write(p)
+	if err == nil && level >= zerolog.ErrorLevel && level <= zerolog.PanicLevel {
+		err = lf.buffered.flush()
+	}
+	return n, err
+}
+
+// Close flushes and stops the console writer started by Init
+func Close() error {
+	if console == nil {
+		return nil
+	}
+	err := console.Close()
+	console = nil
+	return err
+}
+
+// bufferedWriter batches writes in memory and flushes them on a timer,
+// when the buffer fills, and on Close. Writes block rather than drop.
+type bufferedWriter struct {
+	mu   sync.Mutex
+	buf  *bufio.Writer
+	stop chan struct{}
+	done chan struct{}
+}
+
+// newBufferedWriter starts a writer over w that flushes every interval
+func newBufferedWriter(w io.Writer, interval time.Duration) *bufferedWriter {
+	bw := &bufferedWriter{
+		buf:  bufio.NewWriterSize(w, 64*1024),
+		stop: make(chan struct{}),
+		done: make(chan struct{}),
+	}
+	go bw.flushLoop(interval)
+	return bw
+}
+
+// Write buffers p; a full buffer is written through immediately
+func (bw *bufferedWriter) Write(p []byte) (int, error) {
+	bw.mu.Lock()
+	defer bw.mu.Unlock()
+	return bw.buf.Write(p)
+}
+
+// flushLoop periodically pushes buffered events out
+func (bw *bufferedWriter) flushLoop(interval time.Duration) {
+	defer close(bw.done)
+
+	ticker := time.NewTicker(interval)
+	defer ticker.Stop()
+
+	for {
+		select {
+		case <-ticker.C:
+			bw.flush()
+		case <-bw.stop:
+			return
+		}
+	}
+}
+
+// flush writes out any buffered events
+func (bw *bufferedWriter) flush() error {
+	bw.mu.Lock()
+	defer bw.mu.Unlock()
+	return bw.buf.Flush()
+}
+
+// Close stops the timer and flushes what remains
+func (bw *bufferedWriter) Close() error {
+	close(bw.stop)
+	<-bw.done
+	return bw.flush()
 }
 
 // NewLogger creates a new logger with optional writers
@@ -0,0 +1,88 @@
+package logging
+
+import (
+	"bytes"
+	"fmt"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/rs/zerolog"
+)
+
+// lockedBuffer is a bytes.Buffer safe for the flush goroutine and the test
+type lockedBuffer struct {
+	mu  sync.Mutex
+	buf bytes.Buffer
+}
+
+func (b *lockedBuffer) Write(p []byte) (int, error) {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	return b.buf.Write(p)
+}
+
+func (b *lockedBuffer) String() string {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	return b.buf.String()
+}
+
+func TestBufferedWriterKeepsEveryLine(t *testing.T) {
+	var out lockedBuffer
+	bw := newBufferedWriter(&out, time.Hour)
+
+	const writers, lines = 8, 5000
+	var wg sync.WaitGroup
+	for w := 0; w < writers; w++ {
+		wg.Add(1)
+		go func(w int) {
+			defer wg.Done()
+			for i := 0; i < lines; i++ {
+				fmt.Fprintf(bw, "writer %d line %d\n", w, i)
+			}
+		}(w)
+	}
+	wg.Wait()
+
+	if err := bw.Close(); err != nil {
+		t.Fatalf("Close() error: %v", err)
+	}
+	if got := strings.Count(out.String(), "\n"); got != writers*lines {
+		t.Errorf("expected %d lines, got %d", writers*lines, got)
+	}
+}
+
+func TestBufferedWriterFlushesOnTimer(t *testing.T) {
+	var out lockedBuffer
+	bw := newBufferedWriter(&out, 5*time.Millisecond)
+	defer bw.Close()
+
+	fmt.Fprintln(bw, "hello")
+
+	deadline := time.Now().Add(time.Second)
+	for out.String() == "" {
+		if time.Now().After(deadline) {
+			t.Fatal("buffered line was never flushed")
+		}
+		time.Sleep(time.Millisecond)
+	}
+}
+
+func TestLevelFlusherFlushesErrors(t *testing.T) {
+	var out lockedBuffer
+	bw := newBufferedWriter(&out, time.Hour)
+	defer bw.Close()
+	lf := levelFlusher{w: bw, buffered: bw}
+
+	lf.WriteLevel(zerolog.InfoLevel, []byte("info\n"))
+	if out.String() != "" {
+		t.Fatal("expected info events to stay buffered")
+	}
+
+	lf.WriteLevel(zerolog.ErrorLevel, []byte("error\n"))
+	if got := out.String(); got != "info\nerror\n" {
+		t.Errorf("expected both lines flushed in order, got %q", got)
+	}
+}
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"sync"
 	"time"
 
 	"github.com/keagan/slopcannon/internal/ai"
@@ -16,25 +17,42 @@ import (
 
 // Pipeline orchestrates the entire video processing workflow
 type Pipeline struct {
-	logger   zerolog.Logger
-	config   *Config
-	ffmpeg   *ffmpeg.Executor
-	detector *ai.ClipDetector
+	logger zerolog.Logger
+	config *Config
+	ffmpeg *ffmpeg.Executor
+
+	scorerMu sync.Mutex
+	scorer   ai.Scorer // built on first detection, reused until Close
 }
 
 // New creates a new pipeline instance
 func New(logger zerolog.Logger, cfg *Config, appCfg *config.Config) (*Pipeline, error) {
 	if cfg == nil {
 		cfg = &Config{
-			Workers:   4,
+			Workers:   appCfg.Concurrency,
 			ChunkSize: 10,
 			ModelPath: appCfg.AI.ModelPath,
+			UseGPU:    appCfg.AI.UseGPU,
+		}
+	} else {
+		if cfg.ModelPath == "" {
+			cfg.ModelPath = appCfg.AI.ModelPath
 		}
-	} else if cfg.ModelPath == "" {
-		cfg.ModelPath = appCfg.AI.ModelPath
+		cfg.UseGPU = cfg.UseGPU || appCfg.AI.UseGPU
+	}
+	if cfg.IntraOpThreads == 0 {
+		cfg.IntraOpThreads = appCfg.AI.IntraOpThreads
+	}
+	if cfg.InterOpThreads == 0 {
+		cfg.InterOpThreads = appCfg.AI.InterOpThreads
 	}
 
-	ffmpegExec, err := ffmpeg.New(logger, appCfg.FFmpeg.Threads)
+	ffmpegExec, err := ffmpeg.NewWithOptions(logger, ffmpeg.Options{
+		BinaryPath: appCfg.FFmpeg.BinaryPath,
+		Threads:    appCfg.FFmpeg.Threads,
+		HWAccel:    appCfg.FFmpeg.HWAccel,
+		HWEncode:   appCfg.FFmpeg.HWEncode,
+	})
 	if err != nil {
 		return nil, fmt.Errorf("failed to initialize ffmpeg: %w", err)
 	}
@@ -43,7 +61,6 @@ func New(logger zerolog.Logger, cfg *Config, appCfg *config.Config) (*Pipeline,
 		logger: logger.With().Str("component", "pipeline").Logger(),
 		config: cfg,
 		ffmpeg: ffmpegExec,
-		// detector will be created per detectClips call
 	}
 
 	return p, nil
@@ -51,10 +68,15 @@ func New(logger zerolog.Logger, cfg *Config, appCfg *config.Config) (*Pipeline,
 
 // Close releases pipeline resources
 func (p *Pipeline) Close() error {
-	if p.detector != nil {
-		return p.detector.Close()
+	p.scorerMu.Lock()
+	defer p.scorerMu.Unlock()
+
+	if p.scorer == nil {
+		return nil
 	}
-	return nil
+	err := p.scorer.Close()
+	p.scorer = nil
+	return err
 }
 
 // Analyze runs the full analysis pipeline on input video
@@ -69,21 +91,39 @@ func (p *Pipeline) Analyze(ctx context.Context, input string, opts AnalyzeOption
 		return nil, fmt.Errorf("input path cannot be empty")
 	}
 
-	// Stage 1: Extract video metadata
-	videoInfo, err := p.ffmpeg.ProbeVideo(ctx, input)
-	if err != nil {
-		return nil, fmt.Errorf("failed to probe video: %w", err)
-	}
+	// Stages 1-2: Extract video metadata while clips are detected.
+	// The probe is a short read of the container header, so it runs
+	// alongside detection instead of delaying it.
+	runCtx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	var videoInfo *ffmpeg.VideoInfo
+	var probeErr error
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		videoInfo, probeErr = p.ffmpeg.ProbeVideo(runCtx, input)
+		if probeErr != nil {
+			cancel()
+			return
+		}
 
-	p.logger.Info().
-		Dur("duration", videoInfo.Duration).
-		Int("width", videoInfo.Width).
-		Int("height", videoInfo.Height).
-		Float64("fps", videoInfo.FPS).
-		Msg("video metadata extracted")
-
-	// Stage 2: AI-powered clip detection
-	detectedClips, err := p.detectClips(ctx, input, opts)
+		p.logger.Info().
+			Dur("duration", videoInfo.Duration).
+			Int("width", videoInfo.Width).
+			Int("height", videoInfo.Height).
+			Float64("fps", videoInfo.FPS).
+			Msg("video metadata extracted")
+	}()
+
+	// AI-powered clip detection
+	detectedClips, err := p.detectClips(runCtx, input, opts)
+	wg.Wait()
+
+	if probeErr != nil {
+		return nil, fmt.Errorf("failed to probe video: %w", probeErr)
+	}
 	if err != nil {
 		return nil, fmt.Errorf("failed to detect clips: %w", err)
 	}
@@ -168,32 +208,53 @@ func (p *Pipeline) detectClips(ctx context.Context, videoPath string, opts Analy
 	if opts.MaxClips > 0 {
 		detectorCfg.TopN = opts.MaxClips
 	}
+	if p.config.Workers > 0 {
+		detectorCfg.Workers = p.config.Workers
+	}
+	if p.config.EnableCache {
+		cacheDir, err := ai.DefaultAnalysisCacheDir()
+		if err != nil {
+			p.logger.Warn().Err(err).Msg("analysis cache unavailable")
+		} else {
+			detectorCfg.CacheDir = cacheDir
+		}
+	}
 
-	// Build scorer based on model availability
-	scorer := p.buildScorer()
-	defer scorer.Close()
-
-	// Create detector with custom scorer
-	detector := ai.NewClipDetector(p.logger, p.ffmpeg, scorer, detectorCfg)
-	defer detector.Close()
+	// Create detector with the shared scorer; the pipeline owns and closes it
+	detector := ai.NewClipDetector(p.logger, p.ffmpeg, p.getScorer(), detectorCfg)
 
 	return detector.Detect(ctx, videoPath)
 }
 
+// getScorer returns the pipeline's scorer, building it on first use.
+// Model sessions are expensive to load, so they persist across analyses.
+func (p *Pipeline) getScorer() ai.Scorer {
+	p.scorerMu.Lock()
+	defer p.scorerMu.Unlock()
+
+	if p.scorer == nil {
+		p.scorer = p.buildScorer()
+	}
+	return p.scorer
+}
+
 // buildScorer creates appropriate scorer based on pipeline config.
 func (p *Pipeline) buildScorer() ai.Scorer {
 	// Always have heuristic scoring
 	heuristic := ai.NewHeuristicScorer()
 	aesthetic := ai.NewAestheticScorer(p.logger, p.ffmpeg)
+	fallback := func() ai.Scorer {
+		return ai.NewCompositeScorer(
+			[]ai.Scorer{heuristic, aesthetic},
+			[]float64{0.6, 0.4},
+		)
+	}
 
 	modelDir := p.config.ModelPath
 	if modelDir == "" {
 		// No model configured → heuristic + aesthetic only
 		p.logger.Info().Msg("no model path configured; using heuristic + aesthetic scoring")
-		return ai.NewCompositeScorer(
-			[]ai.Scorer{heuristic, aesthetic},
-			[]float64{0.6, 0.4},
-		)
+		return fallback()
 	}
 
 	encoderPath := filepath.Join(modelDir, "clip_image_encoder.onnx")
@@ -204,31 +265,26 @@ func (p *Pipeline) buildScorer() ai.Scorer {
 		p.logger.Warn().Err(err).
 			Str("encoder", encoderPath).
 			Msg("encoder model not found; falling back to heuristic + aesthetic scoring")
-		return ai.NewCompositeScorer(
-			[]ai.Scorer{heuristic, aesthetic},
-			[]float64{0.6, 0.4},
-		)
+		return fallback()
 	}
 	if _, err := os.Stat(headPath); err != nil {
 		p.logger.Warn().Err(err).
 			Str("head", headPath).
 			Msg("virality head model not found; falling back to heuristic + aesthetic scoring")
-		return ai.NewCompositeScorer(
-			[]ai.Scorer{heuristic, aesthetic},
-			[]float64{0.6, 0.4},
-		)
+		return fallback()
 	}
 
-	clipScorer, err := ai.NewCLIPScorer(p.logger, p.ffmpeg, encoderPath, headPath)
+	clipScorer, err := ai.NewCLIPScorerWithOptions(p.logger, p.ffmpeg, encoderPath, headPath, ai.CLIPOptions{
+		UseCUDA:        p.config.UseGPU,
+		IntraOpThreads: p.config.IntraOpThreads,
+		InterOpThreads: p.config.InterOpThreads,
+	})
 	if err != nil {
 		p.logger.Warn().Err(err).
 			Str("encoder", encoderPath).
 			Str("head", headPath).
 			Msg("failed to initialize CLIP scorer; using heuristic + aesthetic scoring")
-		return ai.NewCompositeScorer(
-			[]ai.Scorer{heuristic, aesthetic},
-			[]float64{0.6, 0.4},
-		)
+		return fallback()
 	}
 
 	p.logger.Info().
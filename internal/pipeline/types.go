@@ -69,6 +69,11 @@ type Config struct {
 	EnableCache bool
 	// New: where ONNX models live (directory with clip_image_encoder.onnx, virality_head.onnx)
 	ModelPath string
+	// Run ONNX models on CUDA when the runtime supports it
+	UseGPU bool
+	// ONNX Runtime thread pool sizes; 0 = runtime default
+	IntraOpThreads int
+	InterOpThreads int
 
 	// Other per-pipeline knobs you might have
 	MinClipLength time.Duration
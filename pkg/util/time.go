@@ -7,13 +7,42 @@ import (
 	"time"
 )
 
-// FormatDuration converts time.Duration to ffmpeg timestamp format
+// FormatDuration converts time.Duration to ffmpeg timestamp format (HH:MM:SS.mmm).
+// Uses integer milliseconds, so rounding carries into the next second or minute
+// instead of printing values like "00:00:60.000". Negative durations clamp to zero.
 func FormatDuration(d time.Duration) string {
-	seconds := d.Seconds()
-	hours := int(seconds / 3600)
-	minutes := int((seconds - float64(hours*3600)) / 60)
-	secs := seconds - float64(hours*3600) - float64(minutes*60)
-	return fmt.Sprintf("%02d:%02d:%06.3f", hours, minutes, secs)
+	if d < 0 {
+		d = 0
+	}
+
+	ms := int64((d + time.Millisecond/2) / time.Millisecond)
+	hours := ms / 3600000
+	ms %= 3600000
+	minutes := ms / 60000
+	ms %= 60000
+	secs := ms / 1000
+	ms %= 1000
+
+	buf := make([]byte, 0, 12)
+	buf = appendPadded(buf, hours, 2)
+	buf = append(buf, ':')
+	buf = appendPadded(buf, minutes, 2)
+	buf = append(buf, ':')
+	buf = appendPadded(buf, secs, 2)
+	buf = append(buf, '.')
+	buf = appendPadded(buf, ms, 3)
+	return string(buf)
+}
+
+// appendPadded appends v in decimal, zero-padded to at least width digits
+func appendPadded(buf []byte, v int64, width int) []byte {
+	for limit := int64(1); width > 1; width-- {
+		limit *= 10
+		if v < limit {
+			buf = append(buf, '0')
+		}
+	}
+	return strconv.AppendInt(buf, v, 10)
 }
 
 // ParseTimestamp parses a timestamp string (HH:MM:SS.mmm or SS.mmm or MM:SS)